@@ -1,12 +1,13 @@
 """
 Projects API routes for the Multi-Agent AI System
 """
+import hashlib
 import json
 import logging
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
-from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
@@ -45,6 +46,18 @@ async def _get_archived_project(project_uuid: str) -> dict:
         return None
 
 
+def _status_etag(status: Dict[str, Any]) -> str:
+    """Build an ETag from the fields of a project status that change over time"""
+    key = repr((
+        status["status"],
+        status.get("current_phase"),
+        status.get("progress", 0.0),
+        status.get("completed_at"),
+        status.get("error_message")
+    ))
+    return f'"{hashlib.blake2b(key.encode(), digest_size=8).hexdigest()}"'
+
+
 class ProjectCreateRequest(BaseModel):
     """Request model for creating a new project"""
     name: str = Field(..., min_length=1, max_length=255, description="Project name")
@@ -114,10 +127,14 @@ async def create_project(
 @router.get("/{project_uuid}/status", response_model=ProjectStatusResponse)
 async def get_project_status(
     project_uuid: str,
-    app_request: Request
+    app_request: Request,
+    response: Response
 ):
     """
     Get the current status of a project
+    
+    The response carries an ETag; pollers that send it back in If-None-Match
+    get an empty 304 until the status changes.
     """
     try:
         logger.info(f"Getting status for project: {project_uuid}")
@@ -128,6 +145,11 @@ async def get_project_status(
         # Get project status
         status = await system_manager.get_project_status(project_uuid)
         
+        etag = _status_etag(status)
+        if app_request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+        
         return ProjectStatusResponse(
             project_uuid=status["project_uuid"],
             status=status["status"],
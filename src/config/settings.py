@@ -3,7 +3,7 @@ Multi-Agent AI System Configuration Settings
 """
 from typing import Optional
 from pydantic_settings import BaseSettings
-from pydantic import Field
+from pydantic import AliasChoices, Field
 
 
 class DatabaseSettings(BaseSettings):
@@ -42,6 +42,14 @@ class AIModelSettings(BaseSettings):
     temperature: float = Field(default=0.7)
     max_tokens: int = Field(default=4000)
     
+    # Upper bound on in-flight persona model calls across all debates
+    hive_max_parallel_llm: int = Field(
+        default=10,
+        validation_alias=AliasChoices(
+            "hive_max_parallel_llm", "AI_HIVE_MAX_PARALLEL_LLM", "HIVE_MAX_PARALLEL_LLM"
+        )
+    )
+    
     class Config:
         env_prefix = "AI_"
 
@@ -75,6 +83,7 @@ class SystemSettings(BaseSettings):
     
     # Zone configuration
     max_concurrent_agents: int = Field(default=10)
+    max_concurrent_debates: int = Field(default=8)
     task_timeout_seconds: int = Field(default=300)
     
     # Continuous learning settings
@@ -5,16 +5,35 @@ from sqlalchemy import create_engine, Column, Integer, String, DateTime, Text, B
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from sqlalchemy.sql import func
+import json
 import uuid
 
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - optional speedup
+    orjson = None
+
 from config.settings import settings
 
+# JSON column (de)serialization, using orjson when available
+if orjson is not None:
+    def _json_serializer(value):
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    _json_deserializer = orjson.loads
+else:
+    _json_serializer = json.dumps
+    _json_deserializer = json.loads
+
 # Database setup
 engine = create_engine(
     settings.database.url,
     echo=settings.database.echo,
     pool_size=settings.database.pool_size,
-    max_overflow=settings.database.max_overflow
+    max_overflow=settings.database.max_overflow,
+    pool_pre_ping=True,
+    json_serializer=_json_serializer,
+    json_deserializer=_json_deserializer
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -150,6 +169,7 @@ class DebateSession(Base):
     # Relationships
     project = relationship("Project", back_populates="debate_sessions")
     messages = relationship("DebateMessage", back_populates="session")
+    phases = relationship("DebatePhase", back_populates="session")
 
 
 class DebateMessage(Base):
@@ -174,6 +194,22 @@ class DebateMessage(Base):
     session = relationship("DebateSession", back_populates="messages")
 
 
+class DebatePhase(Base):
+    """Debate phase model for storing the output of each debate phase"""
+    __tablename__ = "debate_phases"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    session_id = Column(Integer, ForeignKey("debate_sessions.id"))
+    phase_name = Column(String(100))  # problem_presentation, individual_analysis, etc.
+    data = Column(JSON, default={})
+    
+    # Timing
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    # Relationships
+    session = relationship("DebateSession", back_populates="phases")
+
+
 class KnowledgeBase(Base):
     """Knowledge base model for continuous learning"""
     __tablename__ = "knowledge_base"
@@ -0,0 +1,17 @@
+"""
+Lifecycle status shared by the zone managers
+"""
+from enum import IntEnum
+
+
+class Status(IntEnum):
+    """Lifecycle state of a zone manager"""
+    INITIALIZING = 0
+    READY = 1
+    ERROR = 2
+    SHUTDOWN = 3
+    
+    @property
+    def label(self) -> str:
+        """Lowercase name reported by get_status()"""
+        return self.name.lower()
@@ -8,6 +8,11 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import uvicorn
 
+try:
+    import uvloop
+except ModuleNotFoundError:  # pragma: no cover - not available on Windows
+    uvloop = None
+
 from config.settings import settings
 from core.database import create_tables
 from api.routes import projects, agents, tasks, debug
@@ -109,6 +114,8 @@ if __name__ == "__main__":
         host=settings.system.api_host,
         port=settings.system.api_port,
         reload=settings.system.debug,
+        # libuv-based event loop for the await-heavy zone managers
+        loop="uvloop" if uvloop is not None else "asyncio",
         log_level=settings.monitoring.log_level.lower()
     )
 
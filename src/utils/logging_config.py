@@ -1,13 +1,39 @@
 """
 Logging configuration for the Multi-Agent AI System
 """
+import atexit
 import logging
 import logging.config
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from config.settings import settings
 
 
+_queue_listener = None
+
+
+def _install_queue_logging():
+    """Route root log records through a queue drained by a background thread"""
+    global _queue_listener
+    
+    if _queue_listener is not None:
+        _queue_listener.stop()
+    
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    for handler in handlers:
+        root.removeHandler(handler)
+    
+    log_queue = queue.SimpleQueue()
+    root.addHandler(QueueHandler(log_queue))
+    
+    _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+    atexit.register(_queue_listener.stop)
+
+
 def setup_logging():
     """Setup logging configuration"""
     
@@ -72,6 +98,9 @@ def setup_logging():
     
     logging.config.dictConfig(logging_config)
     
+    # Keep console/file writes off the event loop
+    _install_queue_logging()
+    
     # Log startup message
     logger = logging.getLogger(__name__)
     logger.info("Logging configuration initialized")
@@ -11,9 +11,10 @@ logger = logging.getLogger(__name__)
 class MockAIResponse:
     """Mock AI response object"""
     
-    def __init__(self, content: str):
+    def __init__(self, content: str, prompt_tokens: int = 0):
         self.content = content
         self.choices = [MockChoice(content)]
+        self.usage = MockUsage(prompt_tokens, len(content) // 4)
 
 
 class MockChoice:
@@ -30,6 +31,16 @@ class MockMessage:
         self.content = content
 
 
+class MockUsage:
+    """Mock token usage object, with roughly four characters per token"""
+    
+    def __init__(self, prompt_tokens: int, completion_tokens: int):
+        self.prompt_tokens = prompt_tokens
+        self.completion_tokens = completion_tokens
+        self.total_tokens = prompt_tokens + completion_tokens
+        self.prompt_tokens_details = None
+
+
 class MockAsyncOpenAI:
     """Mock OpenAI client for testing"""
     
@@ -74,7 +85,8 @@ class MockCompletions:
         # Simulate API delay
         await asyncio.sleep(0.1)
         
-        return MockAIResponse(content)
+        prompt_tokens = sum(len(message.get("content", "")) for message in messages) // 4
+        return MockAIResponse(content, prompt_tokens)
     
     def _generate_analysis_response(self, prompt: str) -> str:
         """Generate mock analysis response"""
@@ -3,8 +3,12 @@ Consensus Engine for Hive Collective Intelligence
 Builds consensus and final decisions from synthesized discussion results
 """
 import logging
+from collections import ChainMap
+from types import MappingProxyType
 from typing import Dict, List, Any
 
+from zone1_hive_collective.personas.base_persona import run_personas_parallel
+
 logger = logging.getLogger(__name__)
 
 
@@ -63,8 +67,9 @@ class ConsensusEngine:
             # Create initial proposed decision from synthesis
             proposed_decision = await self._create_proposed_decision(synthesis_results)
             
-            # Conduct consensus rounds
-            current_proposal = proposed_decision
+            # Conduct consensus rounds against a read-only base; each round
+            # layers its changes on top instead of copying the whole proposal
+            current_proposal = ChainMap(MappingProxyType(proposed_decision))
             
             for round_num in range(self.max_consensus_rounds):
                 logger.info(f"Starting consensus round {round_num + 1}")
@@ -157,13 +162,18 @@ class ConsensusEngine:
             "concerns": []
         }
         
-        # Get consensus input from each persona
-        for persona_name, persona in self.personas.items():
+        # Get consensus input from all personas concurrently
+        consensus_inputs = await run_personas_parallel(
+            self.personas.values(),
+            "provide_consensus_input",
+            synthesis_results,
+            proposed_decision
+        )
+        
+        for persona_name, consensus_input in zip(self.personas, consensus_inputs):
             try:
-                consensus_input = await persona.provide_consensus_input(
-                    synthesis_results,
-                    proposed_decision
-                )
+                if isinstance(consensus_input, Exception):
+                    raise consensus_input
                 
                 round_result["persona_inputs"][persona_name] = consensus_input
                 
@@ -214,32 +224,33 @@ class ConsensusEngine:
     
     async def _update_proposal(
         self,
-        current_proposal: Dict[str, Any],
+        current_proposal: ChainMap,
         round_result: Dict[str, Any]
-    ) -> Dict[str, Any]:
+    ) -> ChainMap:
         """Update proposal based on consensus round feedback"""
-        updated_proposal = current_proposal.copy()
+        # Only the touched keys go into the overlay; earlier layers are shared
+        overlay: Dict[str, Any] = {}
         
         # Incorporate suggested modifications
         modifications = round_result.get("suggested_modifications", [])
         if modifications:
             # Add modifications to implementation plan
-            if "implementation_plan" not in updated_proposal:
-                updated_proposal["implementation_plan"] = {}
-            
-            updated_proposal["implementation_plan"]["modifications"] = modifications[:3]
+            overlay["implementation_plan"] = {
+                **current_proposal.get("implementation_plan", {}),
+                "modifications": modifications[:3]
+            }
         
         # Address critical issues
         critical_issues = round_result.get("critical_issues", [])
         if critical_issues:
-            updated_proposal["critical_issues_addressed"] = critical_issues[:2]
+            overlay["critical_issues_addressed"] = critical_issues[:2]
         
         # Incorporate support reasons
         support_reasons = round_result.get("support_reasons", [])
         if support_reasons:
-            updated_proposal["strengths"] = support_reasons[:3]
+            overlay["strengths"] = support_reasons[:3]
         
-        return updated_proposal
+        return current_proposal.new_child(overlay)
     
     async def _finalize_consensus(
         self,
@@ -265,7 +276,7 @@ class ConsensusEngine:
         )
         
         return {
-            "final_decision": final_proposal,
+            "final_decision": dict(final_proposal),
             "reasoning": reasoning,
             "implementation_guidance": implementation_guidance,
             "areas_of_agreement": list(set(areas_of_agreement))[:5],
@@ -289,7 +300,7 @@ class ConsensusEngine:
         # Create fallback decision
         fallback_decision = {
             "approach": "Majority decision with minority concerns noted",
-            "primary_solution": final_proposal,
+            "primary_solution": dict(final_proposal),
             "dissenting_views": list(set(dissenting_opinions))[:3],
             "unresolved_issues": list(set(remaining_concerns))[:3],
             "recommendation": "Proceed with prototype to validate disputed areas"
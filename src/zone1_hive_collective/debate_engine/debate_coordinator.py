@@ -5,6 +5,8 @@ Manages structured discussions and collaborative problem-solving
 import logging
 from typing import Dict, List, Any
 
+from zone1_hive_collective.personas.base_persona import run_personas_parallel
+
 logger = logging.getLogger(__name__)
 
 
@@ -108,13 +110,18 @@ class DebateCoordinator:
             "improvements": []
         }
         
-        # Get contributions from each persona
-        for persona_name, persona in self.personas.items():
+        # Get contributions from all personas concurrently
+        contributions = await run_personas_parallel(
+            self.personas.values(),
+            "participate_in_discussion",
+            {"session_uuid": session_uuid, "round_number": round_num},
+            context
+        )
+        
+        for persona_name, contribution in zip(self.personas, contributions):
             try:
-                contribution = await persona.participate_in_discussion(
-                    {"session_uuid": session_uuid, "round_number": round_num},
-                    context
-                )
+                if isinstance(contribution, Exception):
+                    raise contribution
                 
                 round_result["contributions"][persona_name] = contribution
                 
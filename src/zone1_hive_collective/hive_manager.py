@@ -2,11 +2,18 @@
 Zone 1: Hive Collective Intelligence Manager
 Manages the strategic decision-making through structured debate and consensus
 """
+import asyncio
+import hashlib
+import json
 import logging
-from typing import Dict, List, Optional, Any
+import reprlib
+from typing import Any
 from datetime import datetime
 
-from core.database import SessionLocal, DebateSession, DebateMessage
+from sqlalchemy import insert, update
+
+from config.settings import settings
+from core.database import SessionLocal, DebateSession, DebateMessage, DebatePhase
 from zone1_hive_collective.personas.architect import ArchitectPersona
 from zone1_hive_collective.personas.innovator import InnovatorPersona
 from zone1_hive_collective.personas.pragmatist import PragmatistPersona
@@ -17,6 +24,60 @@ from zone1_hive_collective.consensus_builder.consensus_engine import ConsensusEn
 
 logger = logging.getLogger(__name__)
 
+# Key considerations and success criteria per debate type
+_CONSIDERATIONS_MAP = {
+    "requirements_analysis": (
+        "Functional requirements clarity",
+        "Non-functional requirements",
+        "Stakeholder needs",
+        "Technical constraints",
+        "Business objectives"
+    ),
+    "architecture_design": (
+        "Scalability requirements",
+        "Performance considerations",
+        "Security requirements",
+        "Maintainability",
+        "Technology selection"
+    ),
+    "test": (
+        "Evaluation criteria",
+        "Comparison factors",
+        "Trade-offs",
+        "Implementation feasibility"
+    )
+}
+_DEFAULT_CONSIDERATIONS = ("General considerations",)
+
+_CRITERIA_MAP = {
+    "requirements_analysis": (
+        "Clear, unambiguous requirements",
+        "Complete coverage of stakeholder needs",
+        "Feasible implementation plan",
+        "Risk mitigation strategies"
+    ),
+    "architecture_design": (
+        "Scalable and maintainable design",
+        "Appropriate technology choices",
+        "Clear component interfaces",
+        "Performance and security considerations"
+    ),
+    "test": (
+        "Objective evaluation",
+        "Comprehensive analysis",
+        "Clear recommendation",
+        "Implementation guidance"
+    )
+}
+_DEFAULT_CRITERIA = ("Successful resolution",)
+
+# Size-bounded repr for context summaries, so large inputs are never fully stringified
+_bounded_repr = reprlib.Repr()
+_bounded_repr.maxstring = 200
+_bounded_repr.maxdict = 8
+_bounded_repr.maxlist = 8
+_bounded_repr.maxother = 200
+
 
 class HiveCollectiveManager:
     """
@@ -24,11 +85,16 @@ class HiveCollectiveManager:
     Coordinates strategic decision-making through structured debate
     """
     
+    SUPPORTED_DEBATE_TYPES = frozenset(_CONSIDERATIONS_MAP)
+    
     def __init__(self):
-        self.personas: Dict[str, Any] = {}
-        self.debate_coordinator: Optional[DebateCoordinator] = None
-        self.consensus_engine: Optional[ConsensusEngine] = None
-        self.active_debates: Dict[str, Dict] = {}
+        self.personas: dict[str, Any] = {}
+        self._persona_names: tuple[str, ...] = ()
+        self._persona_items: tuple[tuple[str, Any], ...] = ()
+        self.debate_coordinator: DebateCoordinator | None = None
+        self.consensus_engine: ConsensusEngine | None = None
+        self.active_debates: dict[str, dict] = {}
+        self._debate_semaphore = asyncio.Semaphore(settings.system.max_concurrent_debates)
         self.status = "initializing"
     
     async def initialize(self):
@@ -44,11 +110,13 @@ class HiveCollectiveManager:
                 "quality_advocate": QualityAdvocatePersona(),
                 "user_champion": UserChampionPersona()
             }
+            self._persona_names = tuple(self.personas)
+            self._persona_items = tuple(self.personas.items())
             
-            # Initialize each persona
-            for name, persona in self.personas.items():
-                await persona.initialize()
-                logger.info(f"Initialized {name} persona")
+            # Initialize each persona concurrently
+            await asyncio.gather(*(persona.initialize() for _, persona in self._persona_items))
+            for name in self._persona_names:
+                logger.info("Initialized %s persona", name)
             
             # Initialize debate coordinator
             self.debate_coordinator = DebateCoordinator(self.personas)
@@ -62,7 +130,7 @@ class HiveCollectiveManager:
             logger.info("Hive Collective Intelligence system initialized successfully")
             
         except Exception as e:
-            logger.error(f"Failed to initialize Hive Collective Intelligence: {e}")
+            logger.error("Failed to initialize Hive Collective Intelligence: %s", e)
             self.status = "error"
             raise
     
@@ -71,8 +139,7 @@ class HiveCollectiveManager:
         logger.info("Shutting down Hive Collective Intelligence system...")
         
         # Shutdown personas
-        for persona in self.personas.values():
-            await persona.shutdown()
+        await asyncio.gather(*(persona.shutdown() for _, persona in self._persona_items))
         
         if self.debate_coordinator:
             await self.debate_coordinator.shutdown()
@@ -85,11 +152,11 @@ class HiveCollectiveManager:
     
     async def create_debate_session(
         self,
-        project_id: Optional[int],
+        project_id: int | None,
         topic: str,
         debate_type: str,
-        input_data: Dict[str, Any]
-    ) -> Dict[str, Any]:
+        input_data: dict[str, Any]
+    ) -> dict[str, Any]:
         """
         Create and execute a debate session
         
@@ -101,71 +168,116 @@ class HiveCollectiveManager:
             
         Returns:
             Debate results and consensus
+            
+        Raises:
+            ValueError: If debate_type is not supported
         """
+        if debate_type not in self.SUPPORTED_DEBATE_TYPES:
+            raise ValueError(f"Unknown debate_type: {debate_type}")
+        
+        # Bound concurrent debates so persona fan-out stays within provider and pool limits
+        async with self._debate_semaphore:
+            try:
+                logger.info("Creating debate session: %s", topic)
+                
+                # Create debate session in database
+                debate_session = await asyncio.to_thread(
+                    self._persist_new_session,
+                    project_id,
+                    topic,
+                    debate_type,
+                    list(self._persona_names)
+                )
+                
+                session_uuid = debate_session.uuid
+                logger.info("Created debate session %s", session_uuid)
+                
+                # Add to active debates
+                created_at = datetime.utcnow()
+                self.active_debates[session_uuid] = {
+                    "session": debate_session,
+                    "db_session_id": debate_session.id,
+                    "pending_messages": [],
+                    "status": "created",
+                    "created_at": created_at,
+                    "created_at_iso": created_at.isoformat(),
+                    "input_data": input_data
+                }
+                
+                # Start debate process
+                debate_result = await self._execute_debate(session_uuid, topic, debate_type, input_data)
+                
+                # Update session status
+                await asyncio.to_thread(
+                    self._update_session,
+                    debate_session.id,
+                    status="completed",
+                    completed_at=datetime.utcnow(),
+                    consensus_reached=debate_result.get("consensus_reached", False),
+                    final_decision=debate_result.get("final_decision", {}),
+                    confidence_score=debate_result.get("confidence_score", 0.0)
+                )
+                
+                # Remove from active debates
+                del self.active_debates[session_uuid]
+                
+                logger.info("Debate session %s completed", session_uuid)
+                return debate_result
+                
+            except Exception as e:
+                logger.error("Failed to create debate session: %s", e)
+                
+                # Mark session as failed
+                if 'debate_session' in locals():
+                    await asyncio.to_thread(self._update_session, debate_session.id, status="failed")
+                
+                raise
+    
+    def _persist_new_session(
+        self,
+        project_id: int | None,
+        topic: str,
+        debate_type: str,
+        participants: list[str]
+    ) -> DebateSession:
+        """Insert a new debate session row (blocking, run off the event loop)"""
+        db = SessionLocal()
         try:
-            logger.info(f"Creating debate session: {topic}")
-            
-            # Create debate session in database
-            db = SessionLocal()
             debate_session = DebateSession(
                 project_id=project_id,
                 topic=topic,
                 debate_type=debate_type,
-                participants=list(self.personas.keys()),
+                participants=participants,
                 status="created"
             )
             db.add(debate_session)
             db.commit()
             db.refresh(debate_session)
-            
-            session_uuid = debate_session.uuid
-            logger.info(f"Created debate session {session_uuid}")
-            
-            # Add to active debates
-            self.active_debates[session_uuid] = {
-                "session": debate_session,
-                "status": "created",
-                "created_at": datetime.utcnow(),
-                "input_data": input_data
-            }
-            
-            # Start debate process
-            debate_result = await self._execute_debate(session_uuid, topic, debate_type, input_data)
-            
-            # Update session status
-            debate_session.status = "completed"
-            debate_session.completed_at = datetime.utcnow()
-            debate_session.consensus_reached = debate_result.get("consensus_reached", False)
-            debate_session.final_decision = debate_result.get("final_decision", {})
-            debate_session.confidence_score = debate_result.get("confidence_score", 0.0)
-            
+            return debate_session
+        finally:
+            db.close()
+    
+    def _update_session(self, session_id: int, **values: Any):
+        """Apply column updates to a debate session (blocking, run off the event loop)"""
+        db = SessionLocal()
+        try:
+            # Single targeted UPDATE of just these columns, no ORM load/flush
+            db.execute(
+                update(DebateSession)
+                .where(DebateSession.id == session_id)
+                .values(**values)
+            )
             db.commit()
+        finally:
             db.close()
-            
-            # Remove from active debates
-            del self.active_debates[session_uuid]
-            
-            logger.info(f"Debate session {session_uuid} completed")
-            return debate_result
-            
-        except Exception as e:
-            logger.error(f"Failed to create debate session: {e}")
-            
-            # Mark session as failed
-            if 'debate_session' in locals():
-                debate_session.status = "failed"
-                db.commit()
-                db.close()
-            
-            raise
     
     async def _execute_debate(
         self,
         session_uuid: str,
         topic: str,
         debate_type: str,
-        input_data: Dict[str, Any]
-    ) -> Dict[str, Any]:
+        input_data: dict[str, Any]
+    ) -> dict[str, Any]:
         """
         Execute the complete debate process
         
@@ -179,22 +291,41 @@ class HiveCollectiveManager:
             Debate results and consensus
         """
         try:
-            logger.info(f"Executing debate for session {session_uuid}")
+            logger.info("Executing debate for session %s", session_uuid)
+            
+            # Each phase's output is persisted as soon as it completes; the
+            # result only carries lightweight handles to the stored phases
+            phases = {}
             
             # Phase 1: Problem Presentation
             problem_context = await self._present_problem(session_uuid, topic, debate_type, input_data)
+            phases["problem_presentation"] = await self._persist_phase(
+                session_uuid, "problem_presentation", problem_context
+            )
             
             # Phase 2: Individual Analysis
             individual_analyses = await self._conduct_individual_analysis(session_uuid, problem_context)
+            phases["individual_analysis"] = await self._persist_phase(
+                session_uuid, "individual_analysis", individual_analyses
+            )
             
             # Phase 3: Collaborative Discussion
             discussion_results = await self._conduct_collaborative_discussion(session_uuid, individual_analyses)
+            phases["collaborative_discussion"] = await self._persist_phase(
+                session_uuid, "collaborative_discussion", discussion_results
+            )
             
             # Phase 4: Synthesis and Integration
             synthesis_results = await self._conduct_synthesis(session_uuid, discussion_results)
+            phases["synthesis"] = await self._persist_phase(
+                session_uuid, "synthesis", synthesis_results
+            )
             
             # Phase 5: Consensus Building
             consensus_results = await self._build_consensus(session_uuid, synthesis_results)
+            phases["consensus"] = await self._persist_phase(
+                session_uuid, "consensus", consensus_results
+            )
             
             # Compile final results
             final_results = {
@@ -206,48 +337,98 @@ class HiveCollectiveManager:
                 "final_decision": consensus_results.get("final_decision", {}),
                 "reasoning": consensus_results.get("reasoning", ""),
                 "implementation_guidance": consensus_results.get("implementation_guidance", {}),
-                "phases": {
-                    "problem_presentation": problem_context,
-                    "individual_analysis": individual_analyses,
-                    "collaborative_discussion": discussion_results,
-                    "synthesis": synthesis_results,
-                    "consensus": consensus_results
-                }
+                "phases": phases
             }
             
-            logger.info(f"Debate execution completed for session {session_uuid}")
+            logger.info("Debate execution completed for session %s", session_uuid)
             return final_results
             
         except Exception as e:
-            logger.error(f"Failed to execute debate for session {session_uuid}: {e}")
+            logger.error("Failed to execute debate for session %s: %s", session_uuid, e)
             raise
+        
+        finally:
+            # Persist the whole transcript in a single commit
+            await asyncio.to_thread(self._flush_messages, session_uuid)
+    
+    async def _persist_phase(
+        self,
+        session_uuid: str,
+        phase_name: str,
+        phase_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Store a completed phase's output and return a handle to it"""
+        phase_id = await asyncio.to_thread(
+            self._store_phase,
+            self.active_debates[session_uuid]["db_session_id"],
+            phase_name,
+            phase_data
+        )
+        return {"phase": phase_name, "id": phase_id}
+    
+    def _store_phase(self, session_id: int, phase_name: str, phase_data: dict[str, Any]) -> int:
+        """Insert a debate phase row (blocking, run off the event loop)"""
+        db = SessionLocal()
+        try:
+            phase = DebatePhase(session_id=session_id, phase_name=phase_name, data=phase_data)
+            db.add(phase)
+            db.commit()
+            return phase.id
+        finally:
+            db.close()
+    
+    async def get_debate_phase(self, phase_id: int) -> dict[str, Any] | None:
+        """Load the full output of a stored debate phase from its handle id"""
+        def _load() -> dict[str, Any] | None:
+            db = SessionLocal()
+            try:
+                return db.query(DebatePhase.data).filter(DebatePhase.id == phase_id).scalar()
+            finally:
+                db.close()
+        
+        return await asyncio.to_thread(_load)
     
     async def _present_problem(
         self,
         session_uuid: str,
         topic: str,
         debate_type: str,
-        input_data: Dict[str, Any]
-    ) -> Dict[str, Any]:
+        input_data: dict[str, Any]
+    ) -> dict[str, Any]:
         """Phase 1: Present the problem to all personas"""
-        logger.info(f"Phase 1: Problem presentation for session {session_uuid}")
+        logger.info("Phase 1: Problem presentation for session %s", session_uuid)
+        
+        # Schedule the summary first so a model-backed summary overlaps with
+        # the local lookups instead of running after them
+        summary_task = asyncio.create_task(
+            self._generate_context_summary(topic, debate_type, input_data)
+        )
+        key_considerations = self._identify_key_considerations(debate_type, input_data)
+        success_criteria = self._define_success_criteria(debate_type, input_data)
         
         problem_context = {
             "topic": topic,
             "debate_type": debate_type,
             "input_data": input_data,
-            "context_summary": await self._generate_context_summary(topic, debate_type, input_data),
-            "key_considerations": await self._identify_key_considerations(debate_type, input_data),
-            "success_criteria": await self._define_success_criteria(debate_type, input_data)
+            "context_summary": await summary_task,
+            "key_considerations": key_considerations,
+            "success_criteria": success_criteria
         }
         
+        # The message references input_data by hash rather than storing it again
+        metadata_light = {k: v for k, v in problem_context.items() if k != "input_data"}
+        metadata_light["input_data_hash"] = hashlib.blake2b(
+            json.dumps(input_data, sort_keys=True, default=str).encode(),
+            digest_size=16
+        ).hexdigest()
+        
         # Store problem presentation message
         await self._store_debate_message(
             session_uuid,
             "system",
             "problem_presentation",
             f"Problem Context: {problem_context['context_summary']}",
-            metadata=problem_context
+            metadata=metadata_light
         )
         
         return problem_context
@@ -255,48 +436,54 @@ class HiveCollectiveManager:
     async def _conduct_individual_analysis(
         self,
         session_uuid: str,
-        problem_context: Dict[str, Any]
-    ) -> Dict[str, Any]:
+        problem_context: dict[str, Any]
+    ) -> dict[str, Any]:
         """Phase 2: Each persona analyzes the problem independently"""
-        logger.info(f"Phase 2: Individual analysis for session {session_uuid}")
+        logger.info("Phase 2: Individual analysis for session %s", session_uuid)
         
-        individual_analyses = {}
+        async def _analyze(persona_name: str, persona: Any) -> dict[str, Any]:
+            analysis = await persona.analyze_problem(problem_context)
+            
+            # Store analysis message
+            await self._store_debate_message(
+                session_uuid,
+                persona_name,
+                "analysis",
+                analysis.get("summary", ""),
+                confidence=analysis.get("confidence", 0.0),
+                reasoning=analysis.get("reasoning", ""),
+                metadata=analysis
+            )
+            
+            logger.info("Received analysis from %s", persona_name)
+            return analysis
         
-        # Get analysis from each persona
-        for persona_name, persona in self.personas.items():
-            try:
-                analysis = await persona.analyze_problem(problem_context)
-                individual_analyses[persona_name] = analysis
-                
-                # Store analysis message
-                await self._store_debate_message(
-                    session_uuid,
-                    persona_name,
-                    "analysis",
-                    analysis.get("summary", ""),
-                    confidence=analysis.get("confidence", 0.0),
-                    reasoning=analysis.get("reasoning", ""),
-                    metadata=analysis
-                )
-                
-                logger.info(f"Received analysis from {persona_name}")
-                
-            except Exception as e:
-                logger.error(f"Failed to get analysis from {persona_name}: {e}")
+        # Personas analyze independently, so their model calls run concurrently
+        results = await asyncio.gather(
+            *(_analyze(name, persona) for name, persona in self._persona_items),
+            return_exceptions=True
+        )
+        
+        individual_analyses = {}
+        for persona_name, result in zip(self._persona_names, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to get analysis from %s: %s", persona_name, result)
                 individual_analyses[persona_name] = {
-                    "error": str(e),
+                    "error": str(result),
                     "confidence": 0.0
                 }
+            else:
+                individual_analyses[persona_name] = result
         
         return individual_analyses
     
     async def _conduct_collaborative_discussion(
         self,
         session_uuid: str,
-        individual_analyses: Dict[str, Any]
-    ) -> Dict[str, Any]:
+        individual_analyses: dict[str, Any]
+    ) -> dict[str, Any]:
         """Phase 3: Collaborative discussion between personas"""
-        logger.info(f"Phase 3: Collaborative discussion for session {session_uuid}")
+        logger.info("Phase 3: Collaborative discussion for session %s", session_uuid)
         
         return await self.debate_coordinator.coordinate_discussion(
             session_uuid,
@@ -306,10 +493,10 @@ class HiveCollectiveManager:
     async def _conduct_synthesis(
         self,
         session_uuid: str,
-        discussion_results: Dict[str, Any]
-    ) -> Dict[str, Any]:
+        discussion_results: dict[str, Any]
+    ) -> dict[str, Any]:
         """Phase 4: Synthesis and integration of ideas"""
-        logger.info(f"Phase 4: Synthesis for session {session_uuid}")
+        logger.info("Phase 4: Synthesis for session %s", session_uuid)
         
         return await self.debate_coordinator.synthesize_ideas(
             session_uuid,
@@ -319,10 +506,10 @@ class HiveCollectiveManager:
     async def _build_consensus(
         self,
         session_uuid: str,
-        synthesis_results: Dict[str, Any]
-    ) -> Dict[str, Any]:
+        synthesis_results: dict[str, Any]
+    ) -> dict[str, Any]:
         """Phase 5: Build consensus on final decision"""
-        logger.info(f"Phase 5: Consensus building for session {session_uuid}")
+        logger.info("Phase 5: Consensus building for session %s", session_uuid)
         
         return await self.consensus_engine.build_consensus(
             session_uuid,
@@ -333,72 +520,28 @@ class HiveCollectiveManager:
         self,
         topic: str,
         debate_type: str,
-        input_data: Dict[str, Any]
+        input_data: dict[str, Any]
     ) -> str:
         """Generate a comprehensive context summary"""
         # This would use an AI model to generate a summary
         # For now, return a structured summary
-        return f"Debate Topic: {topic}\nType: {debate_type}\nKey Data: {str(input_data)[:200]}..."
+        return f"Debate Topic: {topic}\nType: {debate_type}\nKey Data: {_bounded_repr.repr(input_data)}"
     
-    async def _identify_key_considerations(
+    def _identify_key_considerations(
         self,
         debate_type: str,
-        input_data: Dict[str, Any]
-    ) -> List[str]:
+        input_data: dict[str, Any]
+    ) -> tuple[str, ...]:
         """Identify key considerations based on debate type"""
-        considerations_map = {
-            "requirements_analysis": [
-                "Functional requirements clarity",
-                "Non-functional requirements",
-                "Stakeholder needs",
-                "Technical constraints",
-                "Business objectives"
-            ],
-            "architecture_design": [
-                "Scalability requirements",
-                "Performance considerations",
-                "Security requirements",
-                "Maintainability",
-                "Technology selection"
-            ],
-            "test": [
-                "Evaluation criteria",
-                "Comparison factors",
-                "Trade-offs",
-                "Implementation feasibility"
-            ]
-        }
-        
-        return considerations_map.get(debate_type, ["General considerations"])
+        return _CONSIDERATIONS_MAP.get(debate_type, _DEFAULT_CONSIDERATIONS)
     
-    async def _define_success_criteria(
+    def _define_success_criteria(
         self,
         debate_type: str,
-        input_data: Dict[str, Any]
-    ) -> List[str]:
+        input_data: dict[str, Any]
+    ) -> tuple[str, ...]:
         """Define success criteria for the debate"""
-        criteria_map = {
-            "requirements_analysis": [
-                "Clear, unambiguous requirements",
-                "Complete coverage of stakeholder needs",
-                "Feasible implementation plan",
-                "Risk mitigation strategies"
-            ],
-            "architecture_design": [
-                "Scalable and maintainable design",
-                "Appropriate technology choices",
-                "Clear component interfaces",
-                "Performance and security considerations"
-            ],
-            "test": [
-                "Objective evaluation",
-                "Comprehensive analysis",
-                "Clear recommendation",
-                "Implementation guidance"
-            ]
-        }
-        
-        return criteria_map.get(debate_type, ["Successful resolution"])
+        return _CRITERIA_MAP.get(debate_type, _DEFAULT_CRITERIA)
     
     async def _store_debate_message(
         self,
@@ -408,41 +551,64 @@ class HiveCollectiveManager:
         content: str,
         confidence: float = 0.0,
         reasoning: str = "",
-        metadata: Dict[str, Any] = None
+        metadata: dict[str, Any] | None = None
     ):
-        """Store a debate message in the database"""
+        """Queue a debate message for the end-of-debate batched write"""
+        message = {
+            "persona_type": persona_type,
+            "message_type": message_type,
+            "content": content,
+            "confidence": confidence,
+            "reasoning": reasoning,
+            "references": metadata or {}
+        }
+        
+        debate = self.active_debates.get(session_uuid)
+        if debate is None:
+            # Session not tracked by this process, so resolve its id from the database
+            await asyncio.to_thread(self._store_untracked_message, session_uuid, message)
+            return
+        
+        message["session_id"] = debate["db_session_id"]
+        debate["pending_messages"].append(message)
+    
+    def _store_untracked_message(self, session_uuid: str, message: dict[str, Any]):
+        """Write a message for a session missing from active_debates (blocking)"""
+        db = SessionLocal()
         try:
-            db = SessionLocal()
-            
-            # Get session
-            session = db.query(DebateSession).filter(DebateSession.uuid == session_uuid).first()
-            if not session:
-                logger.error(f"Session {session_uuid} not found")
+            session_id = db.query(DebateSession.id).filter(DebateSession.uuid == session_uuid).scalar()
+            if session_id is None:
+                logger.error("Session %s not found", session_uuid)
                 return
             
-            # Create message
-            message = DebateMessage(
-                session_id=session.id,
-                persona_type=persona_type,
-                message_type=message_type,
-                content=content,
-                confidence=confidence,
-                reasoning=reasoning,
-                references=metadata or {}
-            )
-            
-            db.add(message)
+            db.execute(insert(DebateMessage), [{**message, "session_id": session_id}])
             db.commit()
+        except Exception as e:
+            logger.error("Failed to store debate message: %s", e)
+        finally:
             db.close()
-            
+    
+    def _flush_messages(self, session_uuid: str):
+        """Write all queued debate messages for a session in one commit (blocking)"""
+        pending = self.active_debates[session_uuid]["pending_messages"]
+        if not pending:
+            return
+        
+        db = SessionLocal()
+        try:
+            db.execute(insert(DebateMessage), pending)
+            db.commit()
         except Exception as e:
-            logger.error(f"Failed to store debate message: {e}")
+            logger.error("Failed to store debate messages: %s", e)
+        finally:
+            pending.clear()
+            db.close()
     
     def get_status(self) -> str:
         """Get current status of the hive collective system"""
         return self.status
     
-    async def get_active_debates(self) -> Dict[str, Any]:
+    def get_active_debates(self) -> dict[str, Any]:
         """Get information about active debates"""
         return {
             "active_count": len(self.active_debates),
@@ -450,7 +616,7 @@ class HiveCollectiveManager:
                 uuid: {
                     "topic": debate["session"].topic,
                     "status": debate["status"],
-                    "created_at": debate["created_at"].isoformat()
+                    "created_at": debate["created_at_iso"]
                 }
                 for uuid, debate in self.active_debates.items()
             }
@@ -2,7 +2,7 @@
 Architect Persona for Hive Collective Intelligence
 Focuses on system design, scalability, maintainability, and technical excellence
 """
-from zone1_hive_collective.personas.base_persona import BasePersona
+from zone1_hive_collective.personas.base_persona import BasePersona, freeze_knowledge_base
 
 
 class ArchitectPersona(BasePersona):
@@ -10,16 +10,9 @@ class ArchitectPersona(BasePersona):
     Architect persona specializing in system design and technical architecture
     """
     
-    def __init__(self):
-        super().__init__(
-            name="architect",
-            specialization="System Architecture and Technical Design",
-            model=None  # Use default model
-        )
+    __slots__ = ()
     
-    async def _create_system_prompt(self) -> str:
-        """Create the system prompt for the Architect persona"""
-        return """You are the ARCHITECT persona in a hive collective intelligence system. Your role is to focus on system design, scalability, maintainability, and technical excellence.
+    SYSTEM_PROMPT = """You are the ARCHITECT persona in a hive collective intelligence system. Your role is to focus on system design, scalability, maintainability, and technical excellence.
 
 CORE EXPERTISE:
 - Software architecture patterns and principles
@@ -63,55 +56,59 @@ When analyzing problems or participating in discussions:
 
 Always provide detailed technical reasoning for your recommendations and consider both immediate needs and long-term architectural evolution."""
     
-    async def _load_knowledge_base(self):
-        """Load Architect-specific knowledge base"""
-        self.knowledge_base = {
-            "architecture_patterns": [
-                "Microservices Architecture",
-                "Event-Driven Architecture", 
-                "Layered Architecture",
-                "Hexagonal Architecture",
-                "CQRS and Event Sourcing",
-                "Service-Oriented Architecture",
-                "Serverless Architecture"
-            ],
-            "design_principles": [
-                "SOLID Principles",
-                "DRY (Don't Repeat Yourself)",
-                "KISS (Keep It Simple, Stupid)",
-                "YAGNI (You Aren't Gonna Need It)",
-                "Separation of Concerns",
-                "Single Responsibility Principle",
-                "Open/Closed Principle",
-                "Dependency Inversion"
-            ],
-            "scalability_patterns": [
-                "Horizontal vs Vertical Scaling",
-                "Load Balancing Strategies",
-                "Caching Patterns",
-                "Database Sharding",
-                "CDN Implementation",
-                "Asynchronous Processing",
-                "Circuit Breaker Pattern"
-            ],
-            "technology_categories": [
-                "Programming Languages",
-                "Frameworks and Libraries",
-                "Databases (SQL/NoSQL)",
-                "Message Queues",
-                "Caching Solutions",
-                "API Technologies",
-                "Deployment Platforms",
-                "Monitoring Tools"
-            ],
-            "quality_metrics": [
-                "Code Coverage",
-                "Cyclomatic Complexity",
-                "Technical Debt Ratio",
-                "Performance Benchmarks",
-                "Security Vulnerability Scores",
-                "Maintainability Index",
-                "Coupling and Cohesion Metrics"
-            ]
-        }
-
+    KNOWLEDGE_BASE = freeze_knowledge_base({
+        "architecture_patterns": [
+            "Microservices Architecture",
+            "Event-Driven Architecture", 
+            "Layered Architecture",
+            "Hexagonal Architecture",
+            "CQRS and Event Sourcing",
+            "Service-Oriented Architecture",
+            "Serverless Architecture"
+        ],
+        "design_principles": [
+            "SOLID Principles",
+            "DRY (Don't Repeat Yourself)",
+            "KISS (Keep It Simple, Stupid)",
+            "YAGNI (You Aren't Gonna Need It)",
+            "Separation of Concerns",
+            "Single Responsibility Principle",
+            "Open/Closed Principle",
+            "Dependency Inversion"
+        ],
+        "scalability_patterns": [
+            "Horizontal vs Vertical Scaling",
+            "Load Balancing Strategies",
+            "Caching Patterns",
+            "Database Sharding",
+            "CDN Implementation",
+            "Asynchronous Processing",
+            "Circuit Breaker Pattern"
+        ],
+        "technology_categories": [
+            "Programming Languages",
+            "Frameworks and Libraries",
+            "Databases (SQL/NoSQL)",
+            "Message Queues",
+            "Caching Solutions",
+            "API Technologies",
+            "Deployment Platforms",
+            "Monitoring Tools"
+        ],
+        "quality_metrics": [
+            "Code Coverage",
+            "Cyclomatic Complexity",
+            "Technical Debt Ratio",
+            "Performance Benchmarks",
+            "Security Vulnerability Scores",
+            "Maintainability Index",
+            "Coupling and Cohesion Metrics"
+        ]
+    })
+    
+    def __init__(self):
+        super().__init__(
+            name="architect",
+            specialization="System Architecture and Technical Design",
+            model=None  # Use default model
+        )
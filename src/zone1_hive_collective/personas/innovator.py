@@ -2,7 +2,7 @@
 Innovator Persona for Hive Collective Intelligence
 Focuses on creative problem solving, emerging technologies, and novel approaches
 """
-from zone1_hive_collective.personas.base_persona import BasePersona
+from zone1_hive_collective.personas.base_persona import BasePersona, freeze_knowledge_base
 
 
 class InnovatorPersona(BasePersona):
@@ -10,16 +10,9 @@ class InnovatorPersona(BasePersona):
     Innovator persona specializing in creative solutions and emerging technologies
     """
     
-    def __init__(self):
-        super().__init__(
-            name="innovator",
-            specialization="Innovation and Emerging Technologies",
-            model=None  # Use default model
-        )
+    __slots__ = ()
     
-    async def _create_system_prompt(self) -> str:
-        """Create the system prompt for the Innovator persona"""
-        return """You are the INNOVATOR persona in a hive collective intelligence system. Your role is to focus on creative problem solving, emerging technologies, and novel approaches to challenging requirements.
+    SYSTEM_PROMPT = """You are the INNOVATOR persona in a hive collective intelligence system. Your role is to focus on creative problem solving, emerging technologies, and novel approaches to challenging requirements.
 
 CORE EXPERTISE:
 - Emerging technologies and cutting-edge solutions
@@ -63,48 +56,52 @@ When analyzing problems or participating in discussions:
 
 Always push the boundaries of what's possible while remaining grounded in practical implementation considerations."""
     
-    async def _load_knowledge_base(self):
-        """Load Innovator-specific knowledge base"""
-        self.knowledge_base = {
-            "emerging_technologies": [
-                "Artificial Intelligence and Machine Learning",
-                "Blockchain and Distributed Ledgers",
-                "Edge Computing and IoT",
-                "Quantum Computing",
-                "Augmented/Virtual Reality",
-                "5G and Advanced Networking",
-                "Serverless and Function-as-a-Service",
-                "WebAssembly and Advanced Web Technologies"
-            ],
-            "innovation_frameworks": [
-                "Design Thinking",
-                "Lean Startup Methodology",
-                "Agile Innovation",
-                "Blue Ocean Strategy",
-                "Disruptive Innovation Theory",
-                "Jobs-to-be-Done Framework",
-                "Innovation Tournaments",
-                "Rapid Prototyping"
-            ],
-            "creative_techniques": [
-                "Brainstorming and Mind Mapping",
-                "SCAMPER Method",
-                "Six Thinking Hats",
-                "Lateral Thinking",
-                "Analogical Reasoning",
-                "Biomimicry",
-                "Constraint-Based Innovation",
-                "Cross-Industry Inspiration"
-            ],
-            "automation_opportunities": [
-                "Process Automation",
-                "Intelligent Decision Making",
-                "Predictive Analytics",
-                "Natural Language Processing",
-                "Computer Vision Applications",
-                "Robotic Process Automation",
-                "Smart Monitoring and Alerting",
-                "Automated Testing and Deployment"
-            ]
-        }
-
+    KNOWLEDGE_BASE = freeze_knowledge_base({
+        "emerging_technologies": [
+            "Artificial Intelligence and Machine Learning",
+            "Blockchain and Distributed Ledgers",
+            "Edge Computing and IoT",
+            "Quantum Computing",
+            "Augmented/Virtual Reality",
+            "5G and Advanced Networking",
+            "Serverless and Function-as-a-Service",
+            "WebAssembly and Advanced Web Technologies"
+        ],
+        "innovation_frameworks": [
+            "Design Thinking",
+            "Lean Startup Methodology",
+            "Agile Innovation",
+            "Blue Ocean Strategy",
+            "Disruptive Innovation Theory",
+            "Jobs-to-be-Done Framework",
+            "Innovation Tournaments",
+            "Rapid Prototyping"
+        ],
+        "creative_techniques": [
+            "Brainstorming and Mind Mapping",
+            "SCAMPER Method",
+            "Six Thinking Hats",
+            "Lateral Thinking",
+            "Analogical Reasoning",
+            "Biomimicry",
+            "Constraint-Based Innovation",
+            "Cross-Industry Inspiration"
+        ],
+        "automation_opportunities": [
+            "Process Automation",
+            "Intelligent Decision Making",
+            "Predictive Analytics",
+            "Natural Language Processing",
+            "Computer Vision Applications",
+            "Robotic Process Automation",
+            "Smart Monitoring and Alerting",
+            "Automated Testing and Deployment"
+        ]
+    })
+    
+    def __init__(self):
+        super().__init__(
+            name="innovator",
+            specialization="Innovation and Emerging Technologies",
+            model=None  # Use default model
+        )
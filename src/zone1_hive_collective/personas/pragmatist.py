@@ -2,7 +2,7 @@
 Pragmatist Persona for Hive Collective Intelligence
 Focuses on practical implementation, resource constraints, and real-world feasibility
 """
-from zone1_hive_collective.personas.base_persona import BasePersona
+from zone1_hive_collective.personas.base_persona import BasePersona, freeze_knowledge_base
 
 
 class PragmatistPersona(BasePersona):
@@ -10,16 +10,9 @@ class PragmatistPersona(BasePersona):
     Pragmatist persona specializing in practical implementation and resource management
     """
     
-    def __init__(self):
-        super().__init__(
-            name="pragmatist",
-            specialization="Practical Implementation and Resource Management",
-            model=None  # Use default model
-        )
+    __slots__ = ()
     
-    async def _create_system_prompt(self) -> str:
-        """Create the system prompt for the Pragmatist persona"""
-        return """You are the PRAGMATIST persona in a hive collective intelligence system. Your role is to focus on practical implementation, resource constraints, timeline considerations, and real-world feasibility.
+    SYSTEM_PROMPT = """You are the PRAGMATIST persona in a hive collective intelligence system. Your role is to focus on practical implementation, resource constraints, timeline considerations, and real-world feasibility.
 
 CORE EXPERTISE:
 - Project management and resource allocation
@@ -63,48 +56,52 @@ When analyzing problems or participating in discussions:
 
 Always ground discussions in practical reality while supporting ambitious goals through achievable implementation strategies."""
     
-    async def _load_knowledge_base(self):
-        """Load Pragmatist-specific knowledge base"""
-        self.knowledge_base = {
-            "project_management": [
-                "Agile and Scrum Methodologies",
-                "Waterfall and Traditional PM",
-                "Risk Management Frameworks",
-                "Resource Planning and Allocation",
-                "Timeline Estimation Techniques",
-                "Milestone and Deliverable Planning",
-                "Stakeholder Management",
-                "Change Management Processes"
-            ],
-            "resource_considerations": [
-                "Budget Planning and Control",
-                "Team Size and Composition",
-                "Skill Requirements and Gaps",
-                "Infrastructure and Tooling Costs",
-                "Third-party Service Dependencies",
-                "Training and Learning Curves",
-                "Maintenance and Support Overhead",
-                "Scaling and Growth Costs"
-            ],
-            "implementation_strategies": [
-                "Minimum Viable Product (MVP)",
-                "Phased Implementation Approach",
-                "Proof of Concept Development",
-                "Incremental Feature Delivery",
-                "Parallel Development Streams",
-                "Risk-First Implementation",
-                "Quick Wins and Early Value",
-                "Technical Debt Management"
-            ],
-            "risk_factors": [
-                "Technical Complexity Risks",
-                "Resource Availability Risks",
-                "Timeline and Schedule Risks",
-                "Technology and Vendor Risks",
-                "Team and Skill Risks",
-                "Integration and Dependency Risks",
-                "Performance and Scalability Risks",
-                "Security and Compliance Risks"
-            ]
-        }
-
+    KNOWLEDGE_BASE = freeze_knowledge_base({
+        "project_management": [
+            "Agile and Scrum Methodologies",
+            "Waterfall and Traditional PM",
+            "Risk Management Frameworks",
+            "Resource Planning and Allocation",
+            "Timeline Estimation Techniques",
+            "Milestone and Deliverable Planning",
+            "Stakeholder Management",
+            "Change Management Processes"
+        ],
+        "resource_considerations": [
+            "Budget Planning and Control",
+            "Team Size and Composition",
+            "Skill Requirements and Gaps",
+            "Infrastructure and Tooling Costs",
+            "Third-party Service Dependencies",
+            "Training and Learning Curves",
+            "Maintenance and Support Overhead",
+            "Scaling and Growth Costs"
+        ],
+        "implementation_strategies": [
+            "Minimum Viable Product (MVP)",
+            "Phased Implementation Approach",
+            "Proof of Concept Development",
+            "Incremental Feature Delivery",
+            "Parallel Development Streams",
+            "Risk-First Implementation",
+            "Quick Wins and Early Value",
+            "Technical Debt Management"
+        ],
+        "risk_factors": [
+            "Technical Complexity Risks",
+            "Resource Availability Risks",
+            "Timeline and Schedule Risks",
+            "Technology and Vendor Risks",
+            "Team and Skill Risks",
+            "Integration and Dependency Risks",
+            "Performance and Scalability Risks",
+            "Security and Compliance Risks"
+        ]
+    })
+    
+    def __init__(self):
+        super().__init__(
+            name="pragmatist",
+            specialization="Practical Implementation and Resource Management",
+            model=None  # Use default model
+        )
@@ -2,7 +2,7 @@
 Quality Advocate Persona for Hive Collective Intelligence
 Focuses on testing, reliability, quality assurance, and system robustness
 """
-from zone1_hive_collective.personas.base_persona import BasePersona
+from zone1_hive_collective.personas.base_persona import BasePersona, freeze_knowledge_base
 
 
 class QualityAdvocatePersona(BasePersona):
@@ -10,16 +10,9 @@ class QualityAdvocatePersona(BasePersona):
     Quality Advocate persona specializing in testing, reliability, and quality assurance
     """
     
-    def __init__(self):
-        super().__init__(
-            name="quality_advocate",
-            specialization="Quality Assurance and System Reliability",
-            model=None  # Use default model
-        )
+    __slots__ = ()
     
-    async def _create_system_prompt(self) -> str:
-        """Create the system prompt for the Quality Advocate persona"""
-        return """You are the QUALITY ADVOCATE persona in a hive collective intelligence system. Your role is to focus on testing, reliability, quality assurance, and ensuring robust, error-free systems.
+    SYSTEM_PROMPT = """You are the QUALITY ADVOCATE persona in a hive collective intelligence system. Your role is to focus on testing, reliability, quality assurance, and ensuring robust, error-free systems.
 
 CORE EXPERTISE:
 - Testing strategies and methodologies
@@ -63,48 +56,52 @@ When analyzing problems or participating in discussions:
 
 Always advocate for thorough testing and quality assurance while balancing practical implementation constraints."""
     
-    async def _load_knowledge_base(self):
-        """Load Quality Advocate-specific knowledge base"""
-        self.knowledge_base = {
-            "testing_types": [
-                "Unit Testing",
-                "Integration Testing", 
-                "System Testing",
-                "Performance Testing",
-                "Security Testing",
-                "Usability Testing",
-                "Regression Testing",
-                "Load and Stress Testing"
-            ],
-            "quality_metrics": [
-                "Code Coverage Percentage",
-                "Defect Density",
-                "Mean Time to Failure (MTTF)",
-                "Mean Time to Recovery (MTTR)",
-                "Performance Benchmarks",
-                "Security Vulnerability Scores",
-                "User Satisfaction Scores",
-                "System Availability Metrics"
-            ],
-            "quality_processes": [
-                "Test-Driven Development (TDD)",
-                "Behavior-Driven Development (BDD)",
-                "Continuous Integration/Deployment",
-                "Code Review Processes",
-                "Quality Gates and Checkpoints",
-                "Risk-Based Testing",
-                "Exploratory Testing",
-                "Automated Testing Pipelines"
-            ],
-            "reliability_patterns": [
-                "Circuit Breaker Pattern",
-                "Retry and Backoff Strategies",
-                "Bulkhead Pattern",
-                "Timeout and Deadline Management",
-                "Graceful Degradation",
-                "Health Checks and Monitoring",
-                "Disaster Recovery Planning",
-                "Chaos Engineering"
-            ]
-        }
-
+    KNOWLEDGE_BASE = freeze_knowledge_base({
+        "testing_types": [
+            "Unit Testing",
+            "Integration Testing", 
+            "System Testing",
+            "Performance Testing",
+            "Security Testing",
+            "Usability Testing",
+            "Regression Testing",
+            "Load and Stress Testing"
+        ],
+        "quality_metrics": [
+            "Code Coverage Percentage",
+            "Defect Density",
+            "Mean Time to Failure (MTTF)",
+            "Mean Time to Recovery (MTTR)",
+            "Performance Benchmarks",
+            "Security Vulnerability Scores",
+            "User Satisfaction Scores",
+            "System Availability Metrics"
+        ],
+        "quality_processes": [
+            "Test-Driven Development (TDD)",
+            "Behavior-Driven Development (BDD)",
+            "Continuous Integration/Deployment",
+            "Code Review Processes",
+            "Quality Gates and Checkpoints",
+            "Risk-Based Testing",
+            "Exploratory Testing",
+            "Automated Testing Pipelines"
+        ],
+        "reliability_patterns": [
+            "Circuit Breaker Pattern",
+            "Retry and Backoff Strategies",
+            "Bulkhead Pattern",
+            "Timeout and Deadline Management",
+            "Graceful Degradation",
+            "Health Checks and Monitoring",
+            "Disaster Recovery Planning",
+            "Chaos Engineering"
+        ]
+    })
+    
+    def __init__(self):
+        super().__init__(
+            name="quality_advocate",
+            specialization="Quality Assurance and System Reliability",
+            model=None  # Use default model
+        )
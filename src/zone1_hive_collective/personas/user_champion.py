@@ -2,7 +2,7 @@
 User Champion Persona for Hive Collective Intelligence
 Focuses on user experience, stakeholder needs, and human-centered design
 """
-from zone1_hive_collective.personas.base_persona import BasePersona
+from zone1_hive_collective.personas.base_persona import BasePersona, freeze_knowledge_base
 
 
 class UserChampionPersona(BasePersona):
@@ -10,16 +10,9 @@ class UserChampionPersona(BasePersona):
     User Champion persona specializing in user experience and stakeholder advocacy
     """
     
-    def __init__(self):
-        super().__init__(
-            name="user_champion",
-            specialization="User Experience and Stakeholder Advocacy",
-            model=None  # Use default model
-        )
+    __slots__ = ()
     
-    async def _create_system_prompt(self) -> str:
-        """Create the system prompt for the User Champion persona"""
-        return """You are the USER CHAMPION persona in a hive collective intelligence system. Your role is to focus on user experience, stakeholder needs, accessibility, and human-centered design principles.
+    SYSTEM_PROMPT = """You are the USER CHAMPION persona in a hive collective intelligence system. Your role is to focus on user experience, stakeholder needs, accessibility, and human-centered design principles.
 
 CORE EXPERTISE:
 - User experience (UX) design and research
@@ -63,48 +56,52 @@ When analyzing problems or participating in discussions:
 
 Always champion the user perspective while balancing technical constraints and business requirements."""
     
-    async def _load_knowledge_base(self):
-        """Load User Champion-specific knowledge base"""
-        self.knowledge_base = {
-            "ux_principles": [
-                "User-Centered Design",
-                "Design Thinking Process",
-                "Human-Computer Interaction",
-                "Information Architecture",
-                "Interaction Design Patterns",
-                "Visual Design Principles",
-                "Responsive and Adaptive Design",
-                "Mobile-First Design"
-            ],
-            "accessibility_standards": [
-                "WCAG 2.1 Guidelines",
-                "Section 508 Compliance",
-                "ADA Accessibility Requirements",
-                "Inclusive Design Principles",
-                "Screen Reader Compatibility",
-                "Keyboard Navigation Support",
-                "Color Contrast Requirements",
-                "Alternative Text and Descriptions"
-            ],
-            "user_research_methods": [
-                "User Interviews and Surveys",
-                "Usability Testing",
-                "A/B Testing and Experimentation",
-                "User Journey Mapping",
-                "Persona Development",
-                "Card Sorting and Tree Testing",
-                "Heuristic Evaluation",
-                "Analytics and Behavior Analysis"
-            ],
-            "stakeholder_considerations": [
-                "Business Stakeholder Needs",
-                "End User Requirements",
-                "Technical Team Constraints",
-                "Regulatory and Compliance Needs",
-                "Budget and Timeline Constraints",
-                "Market and Competitive Factors",
-                "Organizational Change Management",
-                "Training and Support Requirements"
-            ]
-        }
-
+    KNOWLEDGE_BASE = freeze_knowledge_base({
+        "ux_principles": [
+            "User-Centered Design",
+            "Design Thinking Process",
+            "Human-Computer Interaction",
+            "Information Architecture",
+            "Interaction Design Patterns",
+            "Visual Design Principles",
+            "Responsive and Adaptive Design",
+            "Mobile-First Design"
+        ],
+        "accessibility_standards": [
+            "WCAG 2.1 Guidelines",
+            "Section 508 Compliance",
+            "ADA Accessibility Requirements",
+            "Inclusive Design Principles",
+            "Screen Reader Compatibility",
+            "Keyboard Navigation Support",
+            "Color Contrast Requirements",
+            "Alternative Text and Descriptions"
+        ],
+        "user_research_methods": [
+            "User Interviews and Surveys",
+            "Usability Testing",
+            "A/B Testing and Experimentation",
+            "User Journey Mapping",
+            "Persona Development",
+            "Card Sorting and Tree Testing",
+            "Heuristic Evaluation",
+            "Analytics and Behavior Analysis"
+        ],
+        "stakeholder_considerations": [
+            "Business Stakeholder Needs",
+            "End User Requirements",
+            "Technical Team Constraints",
+            "Regulatory and Compliance Needs",
+            "Budget and Timeline Constraints",
+            "Market and Competitive Factors",
+            "Organizational Change Management",
+            "Training and Support Requirements"
+        ]
+    })
+    
+    def __init__(self):
+        super().__init__(
+            name="user_champion",
+            specialization="User Experience and Stakeholder Advocacy",
+            model=None  # Use default model
+        )
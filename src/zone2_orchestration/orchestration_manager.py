@@ -2,11 +2,34 @@
 Zone 2: Orchestration Manager
 Manages task decomposition, routing, and coordination between zones
 """
+import asyncio
+import hashlib
+import json
 import logging
-from typing import Dict, List, Any
+import sys
+from collections import OrderedDict, deque
+from types import SimpleNamespace
+from typing import Dict, List, Any, Optional
+
+from core.status import Status
 
 logger = logging.getLogger(__name__)
 
+# Decomposed plans are cached as templates with this token in place of the
+# project UUID, keyed by a hash of the decomposition inputs
+_PLAN_PLACEHOLDER = "{PUUID}"
+_PLAN_CACHE_SIZE = 128
+
+# Agent types assigned by decomposed plans, interned once so every task
+# shares the same string objects
+AGENT_TYPES = SimpleNamespace(
+    CODE_GEN=sys.intern("code_generation"),
+    TEST=sys.intern("testing_qa"),
+    DOCS=sys.intern("documentation"),
+    DEVOPS=sys.intern("devops_deployment"),
+    SECURITY=sys.intern("security_agent")
+)
+
 
 class OrchestrationManager:
     """
@@ -17,25 +40,26 @@ class OrchestrationManager:
         self.hive_manager = None
         self.execution_manager = None
         self.assembly_manager = None
-        self.status = "initializing"
-        self.task_queue = []
+        self.status = Status.INITIALIZING
+        self.task_queue: deque[Dict[str, Any]] = deque()
         self.active_tasks = {}
+        self._plan_cache: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
     
     async def initialize(self):
         """Initialize the orchestration manager"""
         try:
             logger.info("Initializing Orchestration Manager...")
-            self.status = "ready"
+            self.status = Status.READY
             logger.info("Orchestration Manager initialized successfully")
         except Exception as e:
-            logger.error(f"Failed to initialize Orchestration Manager: {e}")
-            self.status = "error"
+            logger.error("Failed to initialize Orchestration Manager: %s", e)
+            self.status = Status.ERROR
             raise
     
     async def shutdown(self):
         """Shutdown the orchestration manager"""
         logger.info("Shutting down Orchestration Manager...")
-        self.status = "shutdown"
+        self.status = Status.SHUTDOWN
         logger.info("Orchestration Manager shutdown complete")
     
     def set_hive_manager(self, hive_manager):
@@ -68,69 +92,95 @@ class OrchestrationManager:
             List of tasks to be executed
         """
         try:
-            logger.info(f"Decomposing project {project_uuid} into tasks")
+            logger.info("Decomposing project %s into tasks", project_uuid)
+            
+            # Repeat projects with the same inputs reuse the cached plan
+            cache_key = hashlib.blake2b(
+                json.dumps([requirements_analysis, architecture_design], sort_keys=True, default=str).encode()
+            ).hexdigest()
+            template = self._plan_cache.get(cache_key)
+            if template is None:
+                template = self._build_plan_template(_PLAN_PLACEHOLDER)
+                self._plan_cache[cache_key] = template
+                if len(self._plan_cache) > _PLAN_CACHE_SIZE:
+                    self._plan_cache.popitem(last=False)
+            else:
+                self._plan_cache.move_to_end(cache_key)
             
-            # Mock task decomposition based on project type
             tasks = [
                 {
-                    "uuid": f"task-{project_uuid}-1",
-                    "name": "Setup Project Structure",
-                    "type": "project_setup",
-                    "priority": 1,
-                    "description": "Create project directory structure and configuration",
-                    "agent_type": "devops_deployment",
-                    "dependencies": [],
-                    "estimated_duration": 30
-                },
-                {
-                    "uuid": f"task-{project_uuid}-2",
-                    "name": "Generate Core Code",
-                    "type": "code_generation",
-                    "priority": 2,
-                    "description": "Generate main application code based on requirements",
-                    "agent_type": "code_generation",
-                    "dependencies": [f"task-{project_uuid}-1"],
-                    "estimated_duration": 120
-                },
-                {
-                    "uuid": f"task-{project_uuid}-3",
-                    "name": "Create Tests",
-                    "type": "test_generation",
-                    "priority": 3,
-                    "description": "Generate comprehensive test suite",
-                    "agent_type": "testing_qa",
-                    "dependencies": [f"task-{project_uuid}-2"],
-                    "estimated_duration": 90
-                },
-                {
-                    "uuid": f"task-{project_uuid}-4",
-                    "name": "Generate Documentation",
-                    "type": "documentation",
-                    "priority": 4,
-                    "description": "Create project documentation",
-                    "agent_type": "documentation",
-                    "dependencies": [f"task-{project_uuid}-2"],
-                    "estimated_duration": 60
-                },
-                {
-                    "uuid": f"task-{project_uuid}-5",
-                    "name": "Security Review",
-                    "type": "security_analysis",
-                    "priority": 5,
-                    "description": "Perform security analysis and hardening",
-                    "agent_type": "security_agent",
-                    "dependencies": [f"task-{project_uuid}-2"],
-                    "estimated_duration": 45
+                    **task,
+                    "uuid": task["uuid"].replace(_PLAN_PLACEHOLDER, project_uuid),
+                    "dependencies": [
+                        dep.replace(_PLAN_PLACEHOLDER, project_uuid) for dep in task["dependencies"]
+                    ]
                 }
+                for task in template
             ]
             
-            logger.info(f"Decomposed project {project_uuid} into {len(tasks)} tasks")
+            logger.info("Decomposed project %s into %d tasks", project_uuid, len(tasks))
             return tasks
             
         except Exception as e:
-            logger.error(f"Failed to decompose project {project_uuid}: {e}")
+            logger.error("Failed to decompose project %s: %s", project_uuid, e)
             raise
     
+    def _build_plan_template(self, placeholder: str) -> List[Dict[str, Any]]:
+        """Build the task plan with placeholder standing in for the project UUID"""
+        # Mock task decomposition based on project type
+        return [
+            {
+                "uuid": f"task-{placeholder}-1",
+                "name": "Setup Project Structure",
+                "type": "project_setup",
+                "priority": 1,
+                "description": "Create project directory structure and configuration",
+                "agent_type": AGENT_TYPES.DEVOPS,
+                "dependencies": [],
+                "estimated_duration": 30
+            },
+            {
+                "uuid": f"task-{placeholder}-2",
+                "name": "Generate Core Code",
+                "type": "code_generation",
+                "priority": 2,
+                "description": "Generate main application code based on requirements",
+                "agent_type": AGENT_TYPES.CODE_GEN,
+                "dependencies": [f"task-{placeholder}-1"],
+                "estimated_duration": 120
+            },
+            {
+                "uuid": f"task-{placeholder}-3",
+                "name": "Create Tests",
+                "type": "test_generation",
+                "priority": 3,
+                "description": "Generate comprehensive test suite",
+                "agent_type": AGENT_TYPES.TEST,
+                "dependencies": [f"task-{placeholder}-2"],
+                "estimated_duration": 90
+            },
+            {
+                "uuid": f"task-{placeholder}-4",
+                "name": "Generate Documentation",
+                "type": "documentation",
+                "priority": 4,
+                "description": "Create project documentation",
+                "agent_type": AGENT_TYPES.DOCS,
+                "dependencies": [f"task-{placeholder}-2"],
+                "estimated_duration": 60
+            },
+            {
+                "uuid": f"task-{placeholder}-5",
+                "name": "Security Review",
+                "type": "security_analysis",
+                "priority": 5,
+                "description": "Perform security analysis and hardening",
+                "agent_type": AGENT_TYPES.SECURITY,
+                "dependencies": [f"task-{placeholder}-2"],
+                "estimated_duration": 45
+            }
+        ]
+    
     async def execute_tasks(
         self,
         project_uuid: str,
@@ -147,37 +197,154 @@ class OrchestrationManager:
             Execution results
         """
         try:
-            logger.info(f"Executing {len(tasks)} tasks for project {project_uuid}")
+            logger.info("Executing %d tasks for project %s", len(tasks), project_uuid)
+            
+            # Build the dependency graph; dependencies outside this task list
+            # are treated as already satisfied
+            task_graph = {task["uuid"]: task for task in tasks}
+            pending_deps = {}
+            dependents = {task_uuid: [] for task_uuid in task_graph}
+            for task_uuid, task in task_graph.items():
+                deps = [dep for dep in task.get("dependencies", []) if dep in task_graph]
+                pending_deps[task_uuid] = len(deps)
+                for dep in deps:
+                    dependents[dep].append(task_uuid)
+            
+            # Ready tasks on the longest remaining chain start first; the
+            # index keeps input order among equally critical tasks
+            critical_path = self._critical_path_lengths(task_graph, pending_deps, dependents)
+            order = {task_uuid: index for index, task_uuid in enumerate(task_graph)}
+            
+            queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+            
+            def enqueue(task_uuid: str) -> None:
+                queue.put_nowait((-critical_path[task_uuid], order[task_uuid], task_uuid))
             
-            # Mock execution results
+            task_results = {}
+            prewarms = set()
+            for task_uuid, count in pending_deps.items():
+                if count == 0:
+                    enqueue(task_uuid)
+            
+            async def worker():
+                while True:
+                    task = task_graph[(await queue.get())[2]]
+                    # Warm up downstream agents while this task runs
+                    downstream = {task_graph[dep].get("agent_type") for dep in dependents[task["uuid"]]}
+                    for agent_type in downstream:
+                        prewarm = self._prewarm_agent(agent_type)
+                        if prewarm is not None:
+                            prewarms.add(prewarm)
+                            prewarm.add_done_callback(prewarms.discard)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Running task %s (%s) for project %s",
+                            task["uuid"], task.get("agent_type", "unknown"), project_uuid
+                        )
+                    try:
+                        task_results[task["uuid"]] = await self._run_task(task)
+                    except Exception as e:
+                        logger.error("Task %s failed: %s", task["uuid"], e)
+                        task_results[task["uuid"]] = {
+                            "status": "failed",
+                            "error": str(e),
+                            "agent_used": task.get("agent_type", "unknown")
+                        }
+                    else:
+                        # Release dependents whose last dependency just finished
+                        for dependent in dependents[task["uuid"]]:
+                            pending_deps[dependent] -= 1
+                            if pending_deps[dependent] == 0:
+                                enqueue(dependent)
+                    finally:
+                        queue.task_done()
+            
+            num_workers = min(len(tasks), 8)
+            workers = [asyncio.create_task(worker()) for _ in range(num_workers)]
+            try:
+                await queue.join()
+            finally:
+                for worker_task in workers:
+                    worker_task.cancel()
+                await asyncio.gather(*workers, *prewarms, return_exceptions=True)
+            
+            # Order results like the input, in one pass; tasks blocked behind a
+            # failure (or a dependency cycle) never ran
+            task_results = {
+                task_uuid: task_results.get(task_uuid) or {
+                    "status": "skipped",
+                    "agent_used": task.get("agent_type", "unknown")
+                }
+                for task_uuid, task in task_graph.items()
+            }
+            
+            completed = sum(1 for result in task_results.values() if result["status"] == "completed")
             execution_results = {
                 "project_uuid": project_uuid,
                 "total_tasks": len(tasks),
-                "completed_tasks": len(tasks),
-                "failed_tasks": 0,
-                "task_results": {},
-                "overall_status": "completed",
+                "completed_tasks": completed,
+                "failed_tasks": len(task_results) - completed,
+                "task_results": task_results,
+                "overall_status": "completed" if completed == len(task_results) else "failed",
                 "execution_time": 300  # Mock 5 minutes
             }
             
-            # Mock individual task results
-            for task in tasks:
-                task_uuid = task["uuid"]
-                execution_results["task_results"][task_uuid] = {
-                    "status": "completed",
-                    "output": f"Mock output for {task['name']}",
-                    "duration": task.get("estimated_duration", 60),
-                    "agent_used": task.get("agent_type", "unknown")
-                }
-            
-            logger.info(f"Task execution completed for project {project_uuid}")
+            logger.info("Task execution completed for project %s", project_uuid)
             return execution_results
             
         except Exception as e:
-            logger.error(f"Failed to execute tasks for project {project_uuid}: {e}")
+            logger.error("Failed to execute tasks for project %s: %s", project_uuid, e)
             raise
     
+    @staticmethod
+    def _critical_path_lengths(
+        task_graph: Dict[str, Dict[str, Any]],
+        pending_deps: Dict[str, int],
+        dependents: Dict[str, List[str]]
+    ) -> Dict[str, int]:
+        """Longest estimated duration from each task to the end of its chain"""
+        # Kahn's algorithm for a topological order, then accumulate in reverse
+        remaining = dict(pending_deps)
+        topo_order = [task_uuid for task_uuid, count in remaining.items() if count == 0]
+        for task_uuid in topo_order:
+            for dependent in dependents[task_uuid]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    topo_order.append(dependent)
+        
+        # Tasks caught in a dependency cycle only count their own duration
+        lengths = {
+            task_uuid: task.get("estimated_duration", 60)
+            for task_uuid, task in task_graph.items()
+        }
+        for task_uuid in reversed(topo_order):
+            lengths[task_uuid] += max(
+                (lengths[dependent] for dependent in dependents[task_uuid]), default=0
+            )
+        return lengths
+    
+    def _prewarm_agent(self, agent_type: Optional[str]) -> Optional[asyncio.Task]:
+        """Start loading an agent in the background if it is not loaded yet"""
+        if (
+            agent_type is None
+            or self.execution_manager is None
+            or not hasattr(self.execution_manager, "prewarm_agent")
+            or agent_type in self.execution_manager.active_agents
+        ):
+            return None
+        return asyncio.create_task(self.execution_manager.prewarm_agent(agent_type))
+    
+    async def _run_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a single task with its agent"""
+        # Mock individual task result
+        return {
+            "status": "completed",
+            "output": f"Mock output for {task['name']}",
+            "duration": task.get("estimated_duration", 60),
+            "agent_used": task.get("agent_type", "unknown")
+        }
+    
     def get_status(self) -> str:
         """Get current status of the orchestration manager"""
-        return self.status
+        return self.status.label
 
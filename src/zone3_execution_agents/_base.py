@@ -0,0 +1,162 @@
+"""
+Zone 3: Execution agent manager base
+Lifecycle, agent catalog handling and the mock QA pipeline shared by both
+execution agent managers
+"""
+import logging
+from typing import Any, AsyncIterator, Dict, Mapping, Tuple
+
+from core.status import Status
+from ._catalog import AGENT_CATALOG
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutionAgentManagerBase:
+    """
+    Base manager for specialized execution agents
+
+    Subclasses pick their agents with AGENT_CATALOG and replace the mock QA
+    pipeline by overriding stream_quality_assurance.
+    """
+
+    DISPLAY_NAME = "Execution Agent Manager"
+    AGENT_CATALOG: Mapping[str, Mapping[str, Any]] = AGENT_CATALOG
+
+    def __init__(self):
+        self.orchestration_manager = None
+        self.status = Status.INITIALIZING
+        self.available_agents = {}
+        self.active_agents = {}
+
+    async def initialize(self):
+        """Initialize the execution agent manager"""
+        try:
+            logger.info("Initializing %s...", self.DISPLAY_NAME)
+
+            # Initialize available agent types
+            self.available_agents = type(self).AGENT_CATALOG
+
+            self.status = Status.READY
+            logger.info("Execution Agent Manager initialized successfully")
+
+        except Exception as e:
+            logger.error("Failed to initialize Execution Agent Manager: %s", e)
+            self.status = Status.ERROR
+            raise
+
+    async def shutdown(self):
+        """Shutdown the execution agent manager"""
+        logger.info("Shutting down Execution Agent Manager...")
+        self.status = Status.SHUTDOWN
+        logger.info("Execution Agent Manager shutdown complete")
+
+    def set_orchestration_manager(self, orchestration_manager):
+        """Set reference to orchestration manager"""
+        self.orchestration_manager = orchestration_manager
+
+    async def prewarm_agent(self, agent_type: str) -> None:
+        """Load an agent ahead of the tasks that will use it"""
+        # Only touched from the event loop, so the dict needs no lock
+        if agent_type in self.available_agents:
+            self.active_agents.setdefault(agent_type, self.available_agents[agent_type])
+
+    async def run_quality_assurance(
+        self, project_uuid: str, implementation_results: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Run comprehensive quality assurance on implementation results
+
+        Args:
+            project_uuid: Project UUID
+            implementation_results: Results from implementation phase
+
+        Returns:
+            QA results and recommendations
+        """
+        try:
+            logger.info("Running quality assurance for project %s", project_uuid)
+
+            qa_results: Dict[str, Any] = {}
+            async for phase, data in self.stream_quality_assurance(
+                project_uuid, implementation_results
+            ):
+                if phase == "qa_results":
+                    qa_results = data
+
+            logger.info("Quality assurance completed for project %s", project_uuid)
+            return qa_results
+
+        except Exception as e:
+            logger.error(
+                "Failed to run quality assurance for project %s: %s", project_uuid, e
+            )
+            raise
+
+    async def stream_quality_assurance(
+        self, project_uuid: str, implementation_results: Dict[str, Any]
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Run quality assurance, yielding each phase as soon as it finishes
+
+        Yields ("test_results", ...), ("security_scan", ...) and finally
+        ("qa_results", ...) with the complete results
+        """
+        # Mock QA results
+        qa_results = {
+            "project_uuid": project_uuid,
+            "qa_status": "passed",
+            "test_results": {
+                "unit_tests": {
+                    "total": 25,
+                    "passed": 24,
+                    "failed": 1,
+                    "coverage": 92.5,
+                },
+                "integration_tests": {
+                    "total": 8,
+                    "passed": 8,
+                    "failed": 0,
+                    "coverage": 85.0,
+                },
+                "performance_tests": {
+                    "response_time": "< 200ms",
+                    "throughput": "1000 req/s",
+                    "memory_usage": "< 512MB",
+                    "status": "passed",
+                },
+            },
+            "security_scan": {
+                "vulnerabilities_found": 2,
+                "severity": "low",
+                "recommendations": [
+                    "Update dependency X to latest version",
+                    "Add input validation for endpoint Y",
+                ],
+            },
+            "code_quality": {
+                "maintainability_index": 85,
+                "complexity_score": "low",
+                "duplication": "minimal",
+                "status": "good",
+            },
+            "recommendations": [
+                "Fix failing unit test",
+                "Address security recommendations",
+                "Add more integration test coverage",
+            ],
+            "overall_score": 8.5,
+            "ready_for_deployment": True,
+        }
+
+        yield "test_results", qa_results["test_results"]
+        yield "security_scan", qa_results["security_scan"]
+        yield "qa_results", qa_results
+
+    def get_status(self) -> str:
+        """Get current status of the execution agent manager"""
+        return self.status.label
+
+    def get_available_agents(self) -> Dict[str, Any]:
+        """Get information about available agents"""
+        return self.available_agents
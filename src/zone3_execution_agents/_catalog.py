@@ -0,0 +1,62 @@
+"""
+Zone 3: Execution agent catalog
+Read-only descriptions of the agent types shared by both execution agent managers
+"""
+from types import MappingProxyType
+from typing import Any, Mapping
+
+
+def _agent(name: str, *capabilities: str) -> Mapping[str, Any]:
+    """Build a read-only catalog entry"""
+    return MappingProxyType(
+        {"name": name, "capabilities": capabilities, "status": "ready"}
+    )
+
+
+_SHARED_AGENTS = {
+    "testing_qa": _agent(
+        "Testing and QA Agent",
+        "unit_tests",
+        "integration_tests",
+        "performance_tests",
+    ),
+    "documentation": _agent(
+        "Documentation Agent", "api_docs", "user_guides", "technical_specs"
+    ),
+    "devops_deployment": _agent(
+        "DevOps and Deployment Agent", "docker", "kubernetes", "ci_cd", "monitoring"
+    ),
+    "security_agent": _agent(
+        "Security Agent", "vulnerability_scan", "security_review", "compliance"
+    ),
+    "integration": _agent(
+        "Integration Agent",
+        "api_integration",
+        "data_migration",
+        "system_integration",
+    ),
+}
+
+AGENT_CATALOG: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {
+        "code_generation": _agent(
+            "Code Generation Agent", "python", "javascript", "html", "css", "sql"
+        ),
+        **_SHARED_AGENTS,
+    }
+)
+
+REAL_AGENT_CATALOG: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {
+        "code_generation": _agent(
+            "Real Code Generation Agent",
+            "python",
+            "javascript",
+            "html",
+            "css",
+            "sql",
+            "docker",
+        ),
+        **_SHARED_AGENTS,
+    }
+)
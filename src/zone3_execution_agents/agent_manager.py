@@ -2,157 +2,10 @@
 Zone 3: Execution Agent Manager
 Manages specialized execution agents for different tasks
 """
-import logging
-from typing import Dict, Any
+from ._base import ExecutionAgentManagerBase
 
-logger = logging.getLogger(__name__)
 
-
-class ExecutionAgentManager:
+class ExecutionAgentManager(ExecutionAgentManagerBase):
     """
     Manager for specialized execution agents
     """
-    
-    def __init__(self):
-        self.orchestration_manager = None
-        self.status = "initializing"
-        self.available_agents = {}
-        self.active_agents = {}
-    
-    async def initialize(self):
-        """Initialize the execution agent manager"""
-        try:
-            logger.info("Initializing Execution Agent Manager...")
-            
-            # Initialize available agent types
-            self.available_agents = {
-                "code_generation": {
-                    "name": "Code Generation Agent",
-                    "capabilities": ["python", "javascript", "html", "css", "sql"],
-                    "status": "ready"
-                },
-                "testing_qa": {
-                    "name": "Testing and QA Agent", 
-                    "capabilities": ["unit_tests", "integration_tests", "performance_tests"],
-                    "status": "ready"
-                },
-                "documentation": {
-                    "name": "Documentation Agent",
-                    "capabilities": ["api_docs", "user_guides", "technical_specs"],
-                    "status": "ready"
-                },
-                "devops_deployment": {
-                    "name": "DevOps and Deployment Agent",
-                    "capabilities": ["docker", "kubernetes", "ci_cd", "monitoring"],
-                    "status": "ready"
-                },
-                "security_agent": {
-                    "name": "Security Agent",
-                    "capabilities": ["vulnerability_scan", "security_review", "compliance"],
-                    "status": "ready"
-                },
-                "integration": {
-                    "name": "Integration Agent",
-                    "capabilities": ["api_integration", "data_migration", "system_integration"],
-                    "status": "ready"
-                }
-            }
-            
-            self.status = "ready"
-            logger.info("Execution Agent Manager initialized successfully")
-            
-        except Exception as e:
-            logger.error(f"Failed to initialize Execution Agent Manager: {e}")
-            self.status = "error"
-            raise
-    
-    async def shutdown(self):
-        """Shutdown the execution agent manager"""
-        logger.info("Shutting down Execution Agent Manager...")
-        self.status = "shutdown"
-        logger.info("Execution Agent Manager shutdown complete")
-    
-    def set_orchestration_manager(self, orchestration_manager):
-        """Set reference to orchestration manager"""
-        self.orchestration_manager = orchestration_manager
-    
-    async def run_quality_assurance(
-        self,
-        project_uuid: str,
-        implementation_results: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """
-        Run comprehensive quality assurance on implementation results
-        
-        Args:
-            project_uuid: Project UUID
-            implementation_results: Results from implementation phase
-            
-        Returns:
-            QA results and recommendations
-        """
-        try:
-            logger.info(f"Running quality assurance for project {project_uuid}")
-            
-            # Mock QA results
-            qa_results = {
-                "project_uuid": project_uuid,
-                "qa_status": "passed",
-                "test_results": {
-                    "unit_tests": {
-                        "total": 25,
-                        "passed": 24,
-                        "failed": 1,
-                        "coverage": 92.5
-                    },
-                    "integration_tests": {
-                        "total": 8,
-                        "passed": 8,
-                        "failed": 0,
-                        "coverage": 85.0
-                    },
-                    "performance_tests": {
-                        "response_time": "< 200ms",
-                        "throughput": "1000 req/s",
-                        "memory_usage": "< 512MB",
-                        "status": "passed"
-                    }
-                },
-                "security_scan": {
-                    "vulnerabilities_found": 2,
-                    "severity": "low",
-                    "recommendations": [
-                        "Update dependency X to latest version",
-                        "Add input validation for endpoint Y"
-                    ]
-                },
-                "code_quality": {
-                    "maintainability_index": 85,
-                    "complexity_score": "low",
-                    "duplication": "minimal",
-                    "status": "good"
-                },
-                "recommendations": [
-                    "Fix failing unit test",
-                    "Address security recommendations",
-                    "Add more integration test coverage"
-                ],
-                "overall_score": 8.5,
-                "ready_for_deployment": True
-            }
-            
-            logger.info(f"Quality assurance completed for project {project_uuid}")
-            return qa_results
-            
-        except Exception as e:
-            logger.error(f"Failed to run quality assurance for project {project_uuid}: {e}")
-            raise
-    
-    def get_status(self) -> str:
-        """Get current status of the execution agent manager"""
-        return self.status
-    
-    def get_available_agents(self) -> Dict[str, Any]:
-        """Get information about available agents"""
-        return self.available_agents
-
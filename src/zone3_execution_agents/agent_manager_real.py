@@ -5,150 +5,170 @@ Manages specialized execution agents for different tasks
 
 # mypy: ignore-errors
 
+import asyncio
+import fnmatch
 import logging
-from typing import Dict, List, Any
-from pathlib import Path
+import os
+import re
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Tuple
 
-logger = logging.getLogger(__name__)
+from ._base import ExecutionAgentManagerBase
+from ._catalog import REAL_AGENT_CATALOG
+from .real_code_generator import RealCodeGenerator
 
+logger = logging.getLogger(__name__)
 
-class ExecutionAgentManager:
+# Quality score weights for tests, security and performance
+_SCORE_WEIGHTS = (0.4, 0.4, 0.2)
+# Unit test score mix of pass rate and coverage
+_UNIT_TEST_MIX = (0.6, 0.4)
+# Number of code generation runs allowed on worker threads at once
+_CODEGEN_CONCURRENCY = os.cpu_count() or 1
+# Application generators keyed by requirement keywords, in priority order;
+# requirements matching none of them get the generic application
+_APP_DISPATCH: Tuple[Tuple[re.Pattern, Callable[..., Dict[str, Any]]], ...] = (
+    (re.compile("fintech|cpa", re.I), RealCodeGenerator.generate_fintech_application),
+    (re.compile("chat", re.I), RealCodeGenerator.generate_chat_application),
+)
+
+
+@dataclass(frozen=True)
+class _ProjectScan:
+    """What the QA checks need to know about a generated project's layout"""
+
+    has_backend: bool = False
+    has_backend_tests: bool = False
+    backend_test_files: int = 0
+    has_requirements: bool = False
+    has_frontend: bool = False
+
+
+def _list_dir(path: str) -> Dict[str, os.DirEntry]:
+    """Map entry names to directory entries, or return {} if path is not a directory"""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name: entry for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
+
+def _scan_project(project_path: str) -> _ProjectScan:
+    """Collect the project layout with one directory listing per level"""
+    top = _list_dir(project_path)
+
+    backend = top.get("backend")
+    if backend is None or not backend.is_dir():
+        return _ProjectScan(has_frontend="frontend" in top and top["frontend"].is_dir())
+
+    backend_entries = _list_dir(backend.path)
+    tests = backend_entries.get("tests")
+    has_tests = tests is not None and tests.is_dir()
+    test_files = (
+        len(fnmatch.filter(_list_dir(tests.path), "test_*.py")) if has_tests else 0
+    )
+
+    return _ProjectScan(
+        has_backend=True,
+        has_backend_tests=has_tests,
+        backend_test_files=test_files,
+        has_requirements="requirements.txt" in backend_entries,
+        has_frontend="frontend" in top and top["frontend"].is_dir(),
+    )
+
+
+class ExecutionAgentManager(ExecutionAgentManagerBase):
     """
     Manager for specialized execution agents with real code generation
     """
 
-    def __init__(self):
-        self.orchestration_manager = None
-        self.status = "initializing"
-        self.available_agents = {}
-        self.active_agents = {}
-
-    async def initialize(self):
-        """Initialize the execution agent manager"""
-        try:
-            logger.info(
-                "Initializing Execution Agent Manager with Real Code Generation..."
-            )
+    DISPLAY_NAME = "Execution Agent Manager with Real Code Generation"
+    AGENT_CATALOG = REAL_AGENT_CATALOG
 
-            # Initialize available agent types
-            self.available_agents = {
-                "code_generation": {
-                    "name": "Real Code Generation Agent",
-                    "capabilities": [
-                        "python",
-                        "javascript",
-                        "html",
-                        "css",
-                        "sql",
-                        "docker",
-                    ],
-                    "status": "ready",
-                },
-                "testing_qa": {
-                    "name": "Testing and QA Agent",
-                    "capabilities": [
-                        "unit_tests",
-                        "integration_tests",
-                        "performance_tests",
-                    ],
-                    "status": "ready",
-                },
-                "documentation": {
-                    "name": "Documentation Agent",
-                    "capabilities": ["api_docs", "user_guides", "technical_specs"],
-                    "status": "ready",
-                },
-                "devops_deployment": {
-                    "name": "DevOps and Deployment Agent",
-                    "capabilities": ["docker", "kubernetes", "ci_cd", "monitoring"],
-                    "status": "ready",
-                },
-                "security_agent": {
-                    "name": "Security Agent",
-                    "capabilities": [
-                        "vulnerability_scan",
-                        "security_review",
-                        "compliance",
-                    ],
-                    "status": "ready",
-                },
-                "integration": {
-                    "name": "Integration Agent",
-                    "capabilities": [
-                        "api_integration",
-                        "data_migration",
-                        "system_integration",
-                    ],
-                    "status": "ready",
-                },
-            }
-
-            self.status = "ready"
-            logger.info("Execution Agent Manager initialized successfully")
-
-        except Exception as e:
-            logger.error(f"Failed to initialize Execution Agent Manager: {e}")
-            self.status = "error"
-            raise
-
-    async def shutdown(self):
-        """Shutdown the execution agent manager"""
-        logger.info("Shutting down Execution Agent Manager...")
-        self.status = "shutdown"
-        logger.info("Execution Agent Manager shutdown complete")
-
-    def set_orchestration_manager(self, orchestration_manager):
-        """Set reference to orchestration manager"""
-        self.orchestration_manager = orchestration_manager
-
-    async def run_quality_assurance(
+    def __init__(self):
+        super().__init__()
+        self._scan_cache: Dict[str, asyncio.Task] = {}
+        # Long-lived generators, one per concurrent code generation run;
+        # taking one from the pool is what bounds codegen concurrency
+        self._generators: asyncio.Queue = asyncio.Queue()
+        for _ in range(_CODEGEN_CONCURRENCY):
+            self._generators.put_nowait(RealCodeGenerator())
+
+    async def stream_quality_assurance(
         self, project_uuid: str, implementation_results: Dict[str, Any]
-    ) -> Dict[str, Any]:
+    ) -> AsyncIterator[Tuple[str, Any]]:
         """
-        Run comprehensive quality assurance with real code generation
+        Run quality assurance, yielding each phase as soon as it finishes
+
+        Yields ("code_generation", ...), then ("test_results", ...) and
+        ("security_scan", ...) in completion order, and finally
+        ("qa_results", ...) with the complete results
         """
+        # Create project directory
+        project_dir = f"/tmp/generated_projects/{project_uuid}"
         try:
-            logger.info(
-                f"Running quality assurance with real code generation for project {project_uuid}"
-            )
-
-            # Import and use real code generator
-            from .real_code_generator import RealCodeGenerator
-
-            # Create project directory
-            project_dir = f"/tmp/generated_projects/{project_uuid}"
-            Path(project_dir).mkdir(parents=True, exist_ok=True)
-
-            # Generate real code
-            generator = RealCodeGenerator(project_dir)
-
             # Get project data from implementation results
             project_data = implementation_results.get("project_data", {})
             requirements = project_data.get("requirements", "")
 
             # Generate appropriate application type
-            reqs = requirements.lower()
-            if "fintech" in reqs or "cpa" in reqs:
-                code_result = generator.generate_fintech_application(project_data)
-            elif "chat" in reqs:
-                code_result = generator.generate_chat_application(project_data)
-            else:
-                code_result = generator.generate_generic_application(project_data)
-
-            # Run real tests on generated code
-            test_results = await self._run_real_tests(code_result["project_path"])
-
-            # Run security scan
-            security_results = await self._run_security_scan(
-                code_result["project_path"]
+            build = next(
+                (app for pattern, app in _APP_DISPATCH if pattern.search(requirements)),
+                RealCodeGenerator.generate_generic_application,
             )
 
+            # Generate real code on a worker thread so the event loop stays
+            # responsive during the directory creation and file writes
+            generator = await self._generators.get()
+            try:
+                code_result = await asyncio.to_thread(
+                    self._generate_project, generator, project_dir, build, project_data
+                )
+            finally:
+                self._generators.put_nowait(generator)
+
+            yield "code_generation", code_result
+
+            # Run real tests and the security scan concurrently; they share
+            # one project scan and touch disjoint results
+            async def run_phase(name: str, check: Awaitable[dict]) -> Tuple[str, dict]:
+                return name, await check
+
+            phase_tasks = [
+                asyncio.ensure_future(
+                    run_phase(
+                        "test_results", self._run_real_tests(code_result["project_path"])
+                    )
+                ),
+                asyncio.ensure_future(
+                    run_phase(
+                        "security_scan",
+                        self._run_security_scan(code_result["project_path"]),
+                    )
+                ),
+            ]
+            phases = {}
+            try:
+                for next_phase in asyncio.as_completed(phase_tasks):
+                    name, data = await next_phase
+                    phases[name] = data
+                    yield name, data
+            finally:
+                # A failed phase, or a consumer closing the stream early, must
+                # not leave the other phase running unobserved
+                for task in phase_tasks:
+                    task.cancel()
+                await asyncio.gather(*phase_tasks, return_exceptions=True)
+
+            test_results = phases["test_results"]
+            security_results = phases["security_scan"]
+
             # Calculate quality score
             quality_score = self._calculate_quality_score(
                 test_results, security_results
             )
 
-            qa_results = {
+            yield "qa_results", {
                 "project_uuid": project_uuid,
                 "qa_status": "passed" if quality_score >= 8.0 else "needs_improvement",
                 "test_results": test_results,
@@ -170,16 +190,18 @@ class ExecutionAgentManager:
                 "real_deliverables": True,
             }
 
-            logger.info(
-                f"Quality assurance completed for project {project_uuid} with real code generation"
-            )
-            return qa_results
+        finally:
+            self._scan_cache.pop(project_dir, None)
 
-        except Exception as e:
-            logger.error(
-                f"Failed to run quality assurance for project {project_uuid}: {e}"
+    async def _get_project_scan(self, project_path: str) -> _ProjectScan:
+        """Scan project_path off the event loop, sharing one scan per QA run"""
+        scan_task = self._scan_cache.get(project_path)
+        if scan_task is None:
+            scan_task = asyncio.ensure_future(
+                asyncio.to_thread(_scan_project, project_path)
             )
-            raise
+            self._scan_cache[project_path] = scan_task
+        return await scan_task
 
     async def _run_real_tests(self, project_path: str) -> dict:
         """Run actual tests on generated code"""
@@ -196,12 +218,12 @@ class ExecutionAgentManager:
         if not project_path:
             return test_results
 
+        scan = await self._get_project_scan(project_path)
+
         # Check if backend tests exist and simulate running them
-        backend_test_dir = Path(project_path) / "backend" / "tests"
-        if backend_test_dir.exists():
-            test_files = list(backend_test_dir.glob("test_*.py"))
+        if scan.has_backend_tests:
             test_results["unit_tests"]["total"] = (
-                len(test_files) * 5
+                scan.backend_test_files * 5
             )  # Assume 5 tests per file
             test_results["unit_tests"]["passed"] = (
                 test_results["unit_tests"]["total"] - 1
@@ -210,8 +232,7 @@ class ExecutionAgentManager:
             test_results["unit_tests"]["coverage"] = 92.5
 
         # Check if frontend tests exist
-        frontend_dir = Path(project_path) / "frontend"
-        if frontend_dir.exists():
+        if scan.has_frontend:
             test_results["integration_tests"]["total"] = 8
             test_results["integration_tests"]["passed"] = 8
             test_results["integration_tests"]["failed"] = 0
@@ -236,12 +257,12 @@ class ExecutionAgentManager:
                 "rating": "UNKNOWN",
             }
 
+        scan = await self._get_project_scan(project_path)
+
         # Check for common security issues in generated code
-        backend_dir = Path(project_path) / "backend"
-        if backend_dir.exists():
+        if scan.has_backend:
             # Check requirements.txt for known vulnerabilities
-            req_file = backend_dir / "requirements.txt"
-            if req_file.exists():
+            if scan.has_requirements:
                 security_issues.append(
                     {
                         "severity": "low",
@@ -252,8 +273,7 @@ class ExecutionAgentManager:
                 )
 
         # Check frontend for security issues
-        frontend_dir = Path(project_path) / "frontend"
-        if frontend_dir.exists():
+        if scan.has_frontend:
             security_issues.append(
                 {
                     "severity": "medium",
@@ -270,65 +290,74 @@ class ExecutionAgentManager:
             "rating": "HIGH" if len(security_issues) <= 2 else "MEDIUM",
         }
 
-    def _calculate_quality_score(
-        self, test_results: dict, security_results: dict
-    ) -> float:
+    @staticmethod
+    def _generate_project(
+        generator: RealCodeGenerator,
+        project_dir: str,
+        build: Callable[[RealCodeGenerator, Dict[str, Any]], Dict[str, Any]],
+        project_data: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Create the project directory and generate its code (blocking)"""
+        generator.set_project_dir(project_dir)
+        return build(generator, project_data)
+
+    @staticmethod
+    def _calculate_quality_score(test_results: dict, security_results: dict) -> float:
         """Calculate overall quality score"""
         # Test score based on pass rate and coverage
-        unit_tests = test_results.get("unit_tests", {})
-        total_tests = unit_tests.get("total", 0)
-        passed_tests = unit_tests.get("passed", 0)
-        coverage = unit_tests.get("coverage", 0)
-
-        test_score = 0.5
-        if total_tests > 0:
-            pass_rate = passed_tests / total_tests
-            test_score = (pass_rate * 0.6) + (coverage / 100 * 0.4)
+        unit_tests = test_results["unit_tests"]
+        total_tests = unit_tests["total"]
+        pass_weight, coverage_weight = _UNIT_TEST_MIX
+        test_score = (
+            unit_tests["passed"] / total_tests * pass_weight
+            + unit_tests["coverage"] / 100 * coverage_weight
+            if total_tests
+            else 0.5
+        )
 
         # Security score
-        security_score = 0.9 if security_results.get("status") == "passed" else 0.6
+        security_score = 0.9 if security_results["status"] == "passed" else 0.6
 
         # Performance score
-        perf_status = test_results.get("performance_tests", {}).get("status", "not_run")
-        perf_score = 0.8 if perf_status == "passed" else 0.5
+        perf_score = (
+            0.8 if test_results["performance_tests"]["status"] == "passed" else 0.5
+        )
 
         # Weighted average
-        overall_score = (test_score * 0.4) + (security_score * 0.4) + (perf_score * 0.2)
+        test_weight, security_weight, perf_weight = _SCORE_WEIGHTS
+        overall_score = (
+            test_score * test_weight
+            + security_score * security_weight
+            + perf_score * perf_weight
+        )
 
         return round(overall_score * 10, 1)
 
+    @staticmethod
     def _generate_recommendations(
-        self, test_results: dict, security_results: dict
+        test_results: dict, security_results: dict
     ) -> List[str]:
         """Generate recommendations based on test and security results"""
         recommendations = []
 
         # Test recommendations
-        unit_tests = test_results.get("unit_tests", {})
-        if unit_tests.get("failed", 0) > 0:
+        unit_tests = test_results["unit_tests"]
+        if unit_tests["failed"] > 0:
             recommendations.append("Fix failing unit tests to improve reliability")
 
-        if unit_tests.get("coverage", 0) < 90:
+        if unit_tests["coverage"] < 90:
             recommendations.append("Increase test coverage to at least 90%")
 
         # Security recommendations
-        security_issues = security_results.get("issues", [])
-        for issue in security_issues:
-            recommendations.append(
+        recommendations.extend(
+            [
                 f"Address {issue['severity']} security issue: {issue['description']}"
-            )
+                for issue in security_results["issues"]
+            ]
+        )
 
         # Performance recommendations
-        perf_status = test_results.get("performance_tests", {}).get("status")
-        if perf_status != "passed":
+        if test_results["performance_tests"]["status"] != "passed":
             recommendations.append("Run performance tests to ensure scalability")
 
         return recommendations
-
-    def get_status(self) -> str:
-        """Get current status of the execution agent manager"""
-        return self.status
-
-    def get_available_agents(self) -> Dict[str, Any]:
-        """Get information about available agents"""
-        return self.available_agents
@@ -3,100 +3,27 @@ Real Code Generation Agent
 Generates actual working code files instead of mock responses
 """
 
+import atexit
+import functools
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any
-
-
-class RealCodeGenerator:
-    def __init__(self, project_dir: str):
-        self.project_dir = Path(project_dir)
-        self.project_dir.mkdir(parents=True, exist_ok=True)
-
-    def generate_chat_application(self, requirements: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate a real chat application with actual code files"""
-
-        # Create project structure
-        self._create_project_structure()
-
-        # Generate backend code
-        backend_files = self._generate_backend_code()
-
-        # Generate frontend code
-        frontend_files = self._generate_frontend_code()
-
-        # Generate configuration files
-        config_files = self._generate_config_files()
+from typing import Dict, Any, Optional, Tuple
 
-        # Generate documentation
-        docs = self._generate_documentation()
+# Large enough that any generated file goes out in a single write(2)
+_WRITE_BUFFER_SIZE = 1 << 17
 
-        # Generate tests
-        test_files = self._generate_tests()
+# File templates shipped next to this module
+_TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
 
-        return {
-            "project_path": str(self.project_dir),
-            "files_generated": {
-                "backend": backend_files,
-                "frontend": frontend_files,
-                "config": config_files,
-                "documentation": docs,
-                "tests": test_files,
-            },
-            "total_files": len(backend_files)
-            + len(frontend_files)
-            + len(config_files)
-            + len(docs)
-            + len(test_files),
-        }
-
-    def generate_fintech_application(
-        self, requirements: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Generate a fintech CPA system with specialized agents"""
-
-        self._create_project_structure()
-        backend_files = self._generate_fintech_backend()
-        frontend_files = self._generate_frontend_code()
-        config_files = self._generate_config_files()
-        docs = self._generate_documentation()
-        test_files = self._generate_tests()
-
-        return {
-            "project_path": str(self.project_dir),
-            "files_generated": {
-                "backend": backend_files,
-                "frontend": frontend_files,
-                "config": config_files,
-                "documentation": docs,
-                "tests": test_files,
-            },
-            "total_files": len(backend_files)
-            + len(frontend_files)
-            + len(config_files)
-            + len(docs)
-            + len(test_files),
-        }
-
-    def generate_generic_application(
-        self, requirements: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Generate a generic project scaffold"""
-
-        readme = self.project_dir / "README.md"
-        self.project_dir.mkdir(parents=True, exist_ok=True)
-        readme.write_text(
-            "# Generated Project\n\nThis is a generic starter project.\n",
-            encoding="utf-8",
-        )
-        return {
-            "project_path": str(self.project_dir),
-            "files_generated": {"documentation": ["README.md"]},
-            "total_files": 1,
-        }
-
-    def _create_project_structure(self) -> None:
-        """Create the actual directory structure"""
-        dirs = [
+# Directory structure of generated projects, sorted so parents come first
+_PROJECT_DIRS = tuple(
+    sorted(
+        [
             "backend",
             "backend/app",
             "backend/app/models",
@@ -111,963 +38,210 @@ class RealCodeGenerator:
             "docs",
             "config",
             "database",
-        ]
-
-        for dir_path in dirs:
-            (self.project_dir / dir_path).mkdir(parents=True, exist_ok=True)
-
-    def _generate_backend_code(self) -> List[str]:
-        """Generate actual backend code files"""
-        files_created = []
-
-        # Main FastAPI application
-        main_py = '''"""
-Real-time Chat Application Backend
-FastAPI with WebSocket support
-"""
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Depends, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
-import json
-import asyncio
-from typing import List, Dict
-import jwt
-from datetime import datetime, timedelta
-
-from app.models.database import get_db, engine, Base
-from app.models.user import User
-from app.models.message import Message
-from app.models.room import Room
-from app.routes.auth import auth_router
-from app.routes.rooms import rooms_router
-from app.websocket.connection_manager import ConnectionManager
-
-# Create tables
-Base.metadata.create_all(bind=engine)
-
-app = FastAPI(title="Real-time Chat Application", version="1.0.0")
-
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+        ],
+        key=lambda dir_path: dir_path.count("/"),
+    )
 )
 
-# WebSocket connection manager
-manager = ConnectionManager()
-
-# Include routers
-app.include_router(auth_router, prefix="/api/auth", tags=["authentication"])
-app.include_router(rooms_router, prefix="/api/rooms", tags=["rooms"])
-
-@app.get("/")
-async def root():
-    return {"message": "Real-time Chat Application API", "status": "running"}
-
-@app.get("/health")
-async def health_check():
-    return {"status": "healthy", "timestamp": datetime.utcnow()}
-
-@app.websocket("/ws/{room_id}")
-async def websocket_endpoint(websocket: WebSocket, room_id: str, token: str = None):
-    await manager.connect(websocket, room_id, token)
-    try:
-        while True:
-            data = await websocket.receive_text()
-            message_data = json.loads(data)
-            
-            # Save message to database
-            # Broadcast to room members
-            await manager.broadcast_to_room(room_id, data)
-            
-    except WebSocketDisconnect:
-        manager.disconnect(websocket, room_id)
-
-if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
-'''
-
-        with open(self.project_dir / "backend" / "main.py", "w") as f:
-            f.write(main_py)
-        files_created.append("backend/main.py")
-
-        # Database models
-        database_py = '''"""
-Database configuration and session management
-"""
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-import os
-
-DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./chat_app.db")
-
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-Base = declarative_base()
-
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-'''
-
-        with open(
-            self.project_dir / "backend" / "app" / "models" / "database.py", "w"
-        ) as f:
-            f.write(database_py)
-        files_created.append("backend/app/models/database.py")
-
-        # User model
-        user_py = '''"""
-User model for authentication and user management
-"""
-from sqlalchemy import Column, Integer, String, DateTime, Boolean
-from sqlalchemy.orm import relationship
-from datetime import datetime
-from app.models.database import Base
-
-class User(Base):
-    __tablename__ = "users"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    username = Column(String(50), unique=True, index=True, nullable=False)
-    email = Column(String(100), unique=True, index=True, nullable=False)
-    hashed_password = Column(String(255), nullable=False)
-    full_name = Column(String(100))
-    is_active = Column(Boolean, default=True)
-    is_online = Column(Boolean, default=False)
-    last_seen = Column(DateTime, default=datetime.utcnow)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    
-    # Relationships
-    messages = relationship("Message", back_populates="sender")
-    room_memberships = relationship("RoomMembership", back_populates="user")
-'''
-
-        with open(
-            self.project_dir / "backend" / "app" / "models" / "user.py", "w"
-        ) as f:
-            f.write(user_py)
-        files_created.append("backend/app/models/user.py")
-
-        # Message model
-        message_py = '''"""
-Message model for chat messages
-"""
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
-from sqlalchemy.orm import relationship
-from datetime import datetime
-from app.models.database import Base
-
-class Message(Base):
-    __tablename__ = "messages"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    content = Column(Text, nullable=False)
-    sender_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    room_id = Column(Integer, ForeignKey("rooms.id"), nullable=False)
-    message_type = Column(String(20), default="text")  # text, image, file
-    timestamp = Column(DateTime, default=datetime.utcnow)
-    edited_at = Column(DateTime, nullable=True)
-    is_deleted = Column(Boolean, default=False)
-    
-    # Relationships
-    sender = relationship("User", back_populates="messages")
-    room = relationship("Room", back_populates="messages")
-'''
-
-        with open(
-            self.project_dir / "backend" / "app" / "models" / "message.py", "w"
-        ) as f:
-            f.write(message_py)
-        files_created.append("backend/app/models/message.py")
-
-        # Room model
-        room_py = '''"""
-Room model for chat rooms
-"""
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey
-from sqlalchemy.orm import relationship
-from datetime import datetime
-from app.models.database import Base
-
-class Room(Base):
-    __tablename__ = "rooms"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(100), nullable=False)
-    description = Column(String(500))
-    is_private = Column(Boolean, default=False)
-    created_by = Column(Integer, ForeignKey("users.id"))
-    created_at = Column(DateTime, default=datetime.utcnow)
-    
-    # Relationships
-    messages = relationship("Message", back_populates="room")
-    memberships = relationship("RoomMembership", back_populates="room")
-
-class RoomMembership(Base):
-    __tablename__ = "room_memberships"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"))
-    room_id = Column(Integer, ForeignKey("rooms.id"))
-    joined_at = Column(DateTime, default=datetime.utcnow)
-    role = Column(String(20), default="member")  # admin, moderator, member
-    
-    # Relationships
-    user = relationship("User", back_populates="room_memberships")
-    room = relationship("Room", back_populates="memberships")
-'''
-
-        with open(
-            self.project_dir / "backend" / "app" / "models" / "room.py", "w"
-        ) as f:
-            f.write(room_py)
-        files_created.append("backend/app/models/room.py")
-
-        # WebSocket connection manager
-        connection_manager_py = '''"""
-WebSocket connection manager for real-time communication
-"""
-from fastapi import WebSocket
-from typing import Dict, List
-import json
-import jwt
-from datetime import datetime
-
-class ConnectionManager:
-    def __init__(self):
-        # Store active connections by room
-        self.active_connections: Dict[str, List[WebSocket]] = {}
-        # Store user info for each connection
-        self.connection_users: Dict[WebSocket, dict] = {}
-    
-    async def connect(self, websocket: WebSocket, room_id: str, token: str = None):
-        await websocket.accept()
-        
-        # Verify token and get user info
-        user_info = self._verify_token(token) if token else {"user_id": "anonymous", "username": "Anonymous"}
-        
-        # Add to room connections
-        if room_id not in self.active_connections:
-            self.active_connections[room_id] = []
-        
-        self.active_connections[room_id].append(websocket)
-        self.connection_users[websocket] = {**user_info, "room_id": room_id}
-        
-        # Notify room about new user
-        await self.broadcast_to_room(room_id, json.dumps({
-            "type": "user_joined",
-            "user": user_info,
-            "timestamp": datetime.utcnow().isoformat()
-        }))
-    
-    def disconnect(self, websocket: WebSocket, room_id: str):
-        if room_id in self.active_connections:
-            self.active_connections[room_id].remove(websocket)
-            
-        user_info = self.connection_users.pop(websocket, {})
-        
-        # Notify room about user leaving
-        if room_id in self.active_connections:
-            asyncio.create_task(self.broadcast_to_room(room_id, json.dumps({
-                "type": "user_left", 
-                "user": user_info,
-                "timestamp": datetime.utcnow().isoformat()
-            })))
-    
-    async def broadcast_to_room(self, room_id: str, message: str):
-        if room_id in self.active_connections:
-            for connection in self.active_connections[room_id]:
-                try:
-                    await connection.send_text(message)
-                except:
-                    # Remove dead connections
-                    self.active_connections[room_id].remove(connection)
-    
-    def _verify_token(self, token: str) -> dict:
-        try:
-            # In a real app, verify JWT token
-            payload = jwt.decode(token, "secret_key", algorithms=["HS256"])
-            return {"user_id": payload["user_id"], "username": payload["username"]}
-        except:
-            return {"user_id": "anonymous", "username": "Anonymous"}
-    
-    def get_room_users(self, room_id: str) -> List[dict]:
-        if room_id not in self.active_connections:
-            return []
-        
-        users = []
-        for connection in self.active_connections[room_id]:
-            if connection in self.connection_users:
-                users.append(self.connection_users[connection])
-        return users
-'''
-
-        with open(
-            self.project_dir
-            / "backend"
-            / "app"
-            / "websocket"
-            / "connection_manager.py",
-            "w",
-        ) as f:
-            f.write(connection_manager_py)
-        files_created.append("backend/app/websocket/connection_manager.py")
-
-        return files_created
-
-    def _generate_fintech_backend(self) -> List[str]:
-        """Generate backend files for fintech applications"""
-        files_created: List[str] = []
-        backend_dir = self.project_dir / "backend"
-        backend_dir.mkdir(parents=True, exist_ok=True)
-        main_py = '''"""FinTech CPA Multi-Agent System Backend"""
-from fastapi import FastAPI
-
-app = FastAPI()
-
-@app.get("/health")
-async def health() -> dict:
-    return {"status": "healthy", "system": "fintech_cpa"}
-'''
-        (backend_dir / "main.py").write_text(main_py, encoding="utf-8")
-        files_created.append("backend/main.py")
-        return files_created
-
-    def _generate_frontend_code(self) -> List[str]:
-        """Generate actual React frontend code"""
-        files_created = []
-
-        # Main App component
-        app_jsx = """import React, { useState, useEffect } from 'react';
-import { BrowserRouter as Router, Routes, Route, Navigate } from 'react-router-dom';
-import Login from './pages/Login';
-import Chat from './pages/Chat';
-import RoomList from './pages/RoomList';
-import './App.css';
-
-function App() {
-  const [user, setUser] = useState(null);
-  const [token, setToken] = useState(localStorage.getItem('token'));
-
-  useEffect(() => {
-    if (token) {
-      // Verify token and get user info
-      fetchUserInfo();
-    }
-  }, [token]);
-
-  const fetchUserInfo = async () => {
-    try {
-      const response = await fetch('/api/auth/me', {
-        headers: { Authorization: `Bearer ${token}` }
-      });
-      if (response.ok) {
-        const userData = await response.json();
-        setUser(userData);
-      } else {
-        localStorage.removeItem('token');
-        setToken(null);
-      }
-    } catch (error) {
-      console.error('Error fetching user info:', error);
-    }
-  };
-
-  const handleLogin = (userData, authToken) => {
-    setUser(userData);
-    setToken(authToken);
-    localStorage.setItem('token', authToken);
-  };
-
-  const handleLogout = () => {
-    setUser(null);
-    setToken(null);
-    localStorage.removeItem('token');
-  };
-
-  return (
-    <Router>
-      <div className="App">
-        <Routes>
-          <Route 
-            path="/login" 
-            element={!user ? <Login onLogin={handleLogin} /> : <Navigate to="/rooms" />} 
-          />
-          <Route 
-            path="/rooms" 
-            element={user ? <RoomList user={user} onLogout={handleLogout} /> : <Navigate to="/login" />} 
-          />
-          <Route 
-            path="/chat/:roomId" 
-            element={user ? <Chat user={user} token={token} /> : <Navigate to="/login" />} 
-          />
-          <Route path="/" element={<Navigate to={user ? "/rooms" : "/login"} />} />
-        </Routes>
-      </div>
-    </Router>
-  );
+# Generated files as (path in the project, template) pairs, per section
+_BACKEND_FILES = (
+    ("backend/main.py", "main.py.tpl"),
+    ("backend/app/models/database.py", "database.py.tpl"),
+    ("backend/app/models/user.py", "user.py.tpl"),
+    ("backend/app/models/message.py", "message.py.tpl"),
+    ("backend/app/models/room.py", "room.py.tpl"),
+    ("backend/app/websocket/connection_manager.py", "connection_manager.py.tpl"),
+)
+_FINTECH_BACKEND_FILES = (("backend/main.py", "fintech_main.py.tpl"),)
+_FRONTEND_FILES = (
+    ("frontend/src/App.jsx", "App.jsx.tpl"),
+    ("frontend/src/pages/Chat.jsx", "Chat.jsx.tpl"),
+)
+_CONFIG_FILES = (
+    ("backend/requirements.txt", "requirements.txt.tpl"),
+    ("frontend/package.json", "package.json.tpl"),
+    ("docker-compose.yml", "docker-compose.yml.tpl"),
+)
+_DOCUMENTATION_FILES = (("README.md", "README.md.tpl"),)
+_TEST_FILES = (("backend/tests/test_main.py", "test_main.py.tpl"),)
+
+# Section layout of each application type
+_CHAT_APPLICATION = {
+    "backend": _BACKEND_FILES,
+    "frontend": _FRONTEND_FILES,
+    "config": _CONFIG_FILES,
+    "documentation": _DOCUMENTATION_FILES,
+    "tests": _TEST_FILES,
 }
+_FINTECH_APPLICATION = {**_CHAT_APPLICATION, "backend": _FINTECH_BACKEND_FILES}
 
-export default App;"""
-
-        with open(self.project_dir / "frontend" / "src" / "App.jsx", "w") as f:
-            f.write(app_jsx)
-        files_created.append("frontend/src/App.jsx")
-
-        # Chat component
-        chat_jsx = """import React, { useState, useEffect, useRef } from 'react';
-import { useParams, Link } from 'react-router-dom';
-import './Chat.css';
-
-const Chat = ({ user, token }) => {
-  const { roomId } = useParams();
-  const [messages, setMessages] = useState([]);
-  const [newMessage, setNewMessage] = useState('');
-  const [onlineUsers, setOnlineUsers] = useState([]);
-  const [isTyping, setIsTyping] = useState(false);
-  const [typingUsers, setTypingUsers] = useState([]);
-  const websocket = useRef(null);
-  const messagesEndRef = useRef(null);
-
-  useEffect(() => {
-    // Connect to WebSocket
-    const wsUrl = `ws://localhost:8000/ws/${roomId}?token=${token}`;
-    websocket.current = new WebSocket(wsUrl);
-
-    websocket.current.onopen = () => {
-      /* connection established */
-    };
-
-    websocket.current.onmessage = (event) => {
-      const data = JSON.parse(event.data);
-      
-      if (data.type === 'message') {
-        setMessages(prev => [...prev, data]);
-      } else if (data.type === 'user_joined') {
-        setOnlineUsers(prev => [...prev, data.user]);
-      } else if (data.type === 'user_left') {
-        setOnlineUsers(prev => prev.filter(u => u.user_id !== data.user.user_id));
-      } else if (data.type === 'typing') {
-        if (data.user_id !== user.id) {
-          setTypingUsers(prev => [...prev.filter(id => id !== data.user_id), data.user_id]);
-          setTimeout(() => {
-            setTypingUsers(prev => prev.filter(id => id !== data.user_id));
-          }, 3000);
-        }
-      }
-    };
-
-    websocket.current.onclose = () => {
-      /* connection closed */
-    };
-
-    // Load message history
-    loadMessageHistory();
-
-    return () => {
-      if (websocket.current) {
-        websocket.current.close();
-      }
-    };
-  }, [roomId, token]);
-
-  useEffect(() => {
-    scrollToBottom();
-  }, [messages]);
-
-  const loadMessageHistory = async () => {
-    try {
-      const response = await fetch(`/api/rooms/${roomId}/messages`, {
-        headers: { Authorization: `Bearer ${token}` }
-      });
-      if (response.ok) {
-        const history = await response.json();
-        setMessages(history);
-      }
-    } catch (error) {
-      console.error('Error loading message history:', error);
+# Generated file paths per section, and how many there are, per application
+_MANIFESTS = {
+    name: {
+        section: tuple(path for path, _ in files) for section, files in layout.items()
     }
-  };
-
-  const sendMessage = () => {
-    if (newMessage.trim() && websocket.current) {
-      const messageData = {
-        type: 'message',
-        content: newMessage,
-        sender: user,
-        timestamp: new Date().toISOString(),
-        room_id: roomId
-      };
-      
-      websocket.current.send(JSON.stringify(messageData));
-      setNewMessage('');
-    }
-  };
-
-  const handleKeyPress = (e) => {
-    if (e.key === 'Enter' && !e.shiftKey) {
-      e.preventDefault();
-      sendMessage();
-    } else {
-      // Send typing indicator
-      if (websocket.current && !isTyping) {
-        setIsTyping(true);
-        websocket.current.send(JSON.stringify({
-          type: 'typing',
-          user_id: user.id,
-          username: user.username
-        }));
-        
-        setTimeout(() => setIsTyping(false), 1000);
-      }
-    }
-  };
-
-  const scrollToBottom = () => {
-    messagesEndRef.current?.scrollIntoView({ behavior: 'smooth' });
-  };
-
-  return (
-    <div className="chat-container">
-      <div className="chat-header">
-        <Link to="/rooms" className="back-button">← Back to Rooms</Link>
-        <h2>Room {roomId}</h2>
-        <div className="online-users">
-          Online: {onlineUsers.length}
-        </div>
-      </div>
-
-      <div className="chat-main">
-        <div className="messages-container">
-          {messages.map((message, index) => (
-            <div key={index} className={`message ${message.sender?.id === user.id ? 'own-message' : ''}`}>
-              <div className="message-header">
-                <span className="sender">{message.sender?.username || 'Anonymous'}</span>
-                <span className="timestamp">
-                  {new Date(message.timestamp).toLocaleTimeString()}
-                </span>
-              </div>
-              <div className="message-content">{message.content}</div>
-            </div>
-          ))}
-          
-          {typingUsers.length > 0 && (
-            <div className="typing-indicator">
-              {typingUsers.join(', ')} {typingUsers.length === 1 ? 'is' : 'are'} typing...
-            </div>
-          )}
-          
-          <div ref={messagesEndRef} />
-        </div>
-
-        <div className="online-users-sidebar">
-          <h3>Online Users ({onlineUsers.length})</h3>
-          {onlineUsers.map(user => (
-            <div key={user.user_id} className="online-user">
-              <span className="status-indicator online"></span>
-              {user.username}
-            </div>
-          ))}
-        </div>
-      </div>
-
-      <div className="message-input-container">
-        <textarea
-          value={newMessage}
-          onChange={(e) => setNewMessage(e.target.value)}
-          onKeyPress={handleKeyPress}
-          placeholder="Type your message... (Press Enter to send)"
-          className="message-input"
-          rows="3"
-        />
-        <button onClick={sendMessage} className="send-button">
-          Send
-        </button>
-      </div>
-    </div>
-  );
-};
-
-export default Chat;"""
-
-        with open(
-            self.project_dir / "frontend" / "src" / "pages" / "Chat.jsx", "w"
-        ) as f:
-            f.write(chat_jsx)
-        files_created.append("frontend/src/pages/Chat.jsx")
-
-        return files_created
-
-    def _generate_config_files(self) -> List[str]:
-        """Generate configuration files"""
-        files_created = []
-
-        # Requirements.txt
-        requirements = """fastapi==0.104.1
-uvicorn==0.24.0
-websockets==12.0
-sqlalchemy==2.0.23
-python-jose[cryptography]==3.3.0
-passlib[bcrypt]==1.7.4
-python-multipart==0.0.6
-python-dotenv==1.0.0
-pytest==7.4.3
-pytest-asyncio==0.21.1
-httpx==0.25.2
-"""
-
-        with open(self.project_dir / "backend" / "requirements.txt", "w") as f:
-            f.write(requirements)
-        files_created.append("backend/requirements.txt")
-
-        # Package.json for frontend
-        package_json = """{
-  "name": "chat-frontend",
-  "version": "1.0.0",
-  "private": true,
-  "dependencies": {
-    "react": "^18.2.0",
-    "react-dom": "^18.2.0",
-    "react-router-dom": "^6.8.0",
-    "axios": "^1.6.0",
-    "socket.io-client": "^4.7.4"
-  },
-  "scripts": {
-    "start": "react-scripts start",
-    "build": "react-scripts build",
-    "test": "react-scripts test",
-    "eject": "react-scripts eject"
-  },
-  "devDependencies": {
-    "react-scripts": "5.0.1"
-  },
-  "browserslist": {
-    "production": [
-      ">0.2%",
-      "not dead",
-      "not op_mini all"
-    ],
-    "development": [
-      "last 1 chrome version",
-      "last 1 firefox version",
-      "last 1 safari version"
-    ]
-  }
-}"""
-
-        with open(self.project_dir / "frontend" / "package.json", "w") as f:
-            f.write(package_json)
-        files_created.append("frontend/package.json")
-
-        # Docker Compose
-        docker_compose = """version: '3.8'
-
-services:
-  backend:
-    build: ./backend
-    ports:
-      - "8000:8000"
-    environment:
-      - DATABASE_URL=postgresql://chat_user:chat_pass@db:5432/chat_db
-      - SECRET_KEY=your-secret-key-here
-    depends_on:
-      - db
-      - redis
-    volumes:
-      - ./backend:/app
-    command: uvicorn main:app --host 0.0.0.0 --port 8000 --reload
-
-  frontend:
-    build: ./frontend
-    ports:
-      - "3000:3000"
-    volumes:
-      - ./frontend:/app
-      - /app/node_modules
-    command: npm start
-
-  db:
-    image: postgres:15
-    environment:
-      - POSTGRES_DB=chat_db
-      - POSTGRES_USER=chat_user
-      - POSTGRES_PASSWORD=chat_pass
-    volumes:
-      - postgres_data:/var/lib/postgresql/data
-    ports:
-      - "5432:5432"
-
-  redis:
-    image: redis:7-alpine
-    ports:
-      - "6379:6379"
-
-volumes:
-  postgres_data:
-"""
-
-        with open(self.project_dir / "docker-compose.yml", "w") as f:
-            f.write(docker_compose)
-        files_created.append("docker-compose.yml")
-
-        return files_created
-
-    def _generate_documentation(self) -> List[str]:
-        """Generate real documentation"""
-        files_created = []
-
-        readme = """# Real-time Chat Application
-
-A modern, real-time chat application built with FastAPI (backend) and React (frontend).
-
-## Features
-
-- ✅ Real-time messaging with WebSocket
-- ✅ User authentication and authorization
-- ✅ Multiple chat rooms
-- ✅ Private messaging
-- ✅ Online status indicators
-- ✅ Typing indicators
-- ✅ Message history
-- ✅ Responsive design
-- ✅ Docker deployment
-
-## Tech Stack
-
-### Backend
-- **FastAPI** - Modern Python web framework
-- **WebSocket** - Real-time communication
-- **SQLAlchemy** - Database ORM
-- **PostgreSQL** - Primary database
-- **Redis** - Caching and session storage
-- **JWT** - Authentication tokens
-
-### Frontend
-- **React** - UI framework
-- **React Router** - Navigation
-- **WebSocket API** - Real-time communication
-- **CSS3** - Styling
-
-## Quick Start
-
-### Using Docker (Recommended)
-
-1. Clone the repository
-2. Run with Docker Compose:
-```bash
-docker-compose up --build
-```
-
-3. Access the application:
-   - Frontend: http://localhost:3000
-   - Backend API: http://localhost:8000
-   - API Documentation: http://localhost:8000/docs
-
-### Manual Setup
-
-#### Backend Setup
-```bash
-cd backend
-pip install -r requirements.txt
-uvicorn main:app --reload
-```
-
-#### Frontend Setup
-```bash
-cd frontend
-npm install
-npm start
-```
-
-## API Endpoints
-
-### Authentication
-- `POST /api/auth/register` - Register new user
-- `POST /api/auth/login` - User login
-- `GET /api/auth/me` - Get current user info
-
-### Rooms
-- `GET /api/rooms/` - List all rooms
-- `POST /api/rooms/` - Create new room
-- `GET /api/rooms/{room_id}` - Get room details
-- `GET /api/rooms/{room_id}/messages` - Get room message history
-
-### WebSocket
-- `WS /ws/{room_id}` - Connect to room for real-time messaging
-
-## Project Structure
-
-```
-chat-application/
-├── backend/
-│   ├── main.py                 # FastAPI application
-│   ├── app/
-│   │   ├── models/            # Database models
-│   │   ├── routes/            # API routes
-│   │   └── websocket/         # WebSocket handlers
-│   ├── tests/                 # Backend tests
-│   └── requirements.txt       # Python dependencies
-├── frontend/
-│   ├── src/
-│   │   ├── components/        # React components
-│   │   ├── pages/            # Page components
-│   │   └── App.jsx           # Main app component
-│   ├── public/               # Static files
-│   └── package.json          # Node.js dependencies
-├── docs/                     # Documentation
-├── docker-compose.yml        # Docker orchestration
-└── README.md                # This file
-```
-
-## Development
-
-### Running Tests
-```bash
-# Backend tests
-cd backend
-pytest
-
-# Frontend tests
-cd frontend
-npm test
-```
-
-### Database Migrations
-```bash
-# Create migration
-alembic revision --autogenerate -m "description"
-
-# Apply migration
-alembic upgrade head
-```
-
-## Deployment
-
-### Production Deployment
-1. Set environment variables
-2. Build Docker images
-3. Deploy with Docker Compose or Kubernetes
-
-### Environment Variables
-- `DATABASE_URL` - PostgreSQL connection string
-- `SECRET_KEY` - JWT secret key
-- `REDIS_URL` - Redis connection string
-
-## Contributing
-
-1. Fork the repository
-2. Create feature branch
-3. Make changes
-4. Add tests
-5. Submit pull request
+    for name, layout in (("chat", _CHAT_APPLICATION), ("fintech", _FINTECH_APPLICATION))
+}
+_TOTAL_FILES = {
+    name: sum(len(paths) for paths in manifest.values())
+    for name, manifest in _MANIFESTS.items()
+}
 
-## License
+# Generic scaffold README, kept as bytes so nothing is encoded per project
+_GENERIC_README = b"# Generated Project\n\nThis is a generic starter project.\n"
 
-MIT License - see LICENSE file for details.
-"""
 
-        with open(self.project_dir / "README.md", "w") as f:
-            f.write(readme)
-        files_created.append("README.md")
+def _digest(path: str) -> bytes:
+    """BLAKE2b digest of a file's contents"""
+    with open(path, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=16).digest()
 
-        return files_created
 
-    def _generate_tests(self) -> List[str]:
-        """Generate real test files"""
-        files_created = []
+# Skeleton files never change once built
+_skeleton_digest = functools.lru_cache(maxsize=None)(_digest)
 
-        # Backend tests
-        test_main = '''"""
-Tests for main FastAPI application
-"""
-import pytest
-from fastapi.testclient import TestClient
-from main import app
 
-client = TestClient(app)
+def _copy_if_changed(src: str, dst: str) -> str:
+    """Copy a skeleton file unless dst already holds the same content"""
+    try:
+        same_size = os.path.getsize(dst) == os.path.getsize(src)
+        if same_size and _digest(dst) == _skeleton_digest(src):
+            return dst
+    except OSError:
+        pass
+    return shutil.copyfile(src, dst)
+
+
+def _skeleton_intact(
+    skeleton: str, sections: Dict[str, Tuple[Tuple[str, str], ...]]
+) -> bool:
+    """Whether every file of a prebuilt skeleton is still on disk"""
+    return all(
+        os.path.isfile(os.path.join(skeleton, rel_path))
+        for section in sections.values()
+        for rel_path, _ in section
+    )
 
-def test_root_endpoint():
-    response = client.get("/")
-    assert response.status_code == 200
-    assert "Real-time Chat Application API" in response.json()["message"]
 
-def test_health_check():
-    response = client.get("/health")
-    assert response.status_code == 200
-    assert response.json()["status"] == "healthy"
+class RealCodeGenerator:
+    # Prebuilt application skeletons for this process, by application name
+    _skeletons: Dict[str, str] = {}
+    _skeleton_lock = threading.Lock()
+
+    def __init__(self, project_dir: Optional[str] = None):
+        self.project_dir: Optional[Path] = None
+        # String form of project_dir, for cheap os.path joins
+        self._base: Optional[str] = None
+        if project_dir is not None:
+            self.set_project_dir(project_dir)
+
+    def set_project_dir(self, project_dir: str) -> None:
+        """Point the generator at the directory the next project is written to"""
+        # The directory itself is created along with the project structure
+        self.project_dir = Path(project_dir)
+        self._base = os.fspath(self.project_dir)
+
+    def _write(self, rel_path: str, contents: bytes) -> None:
+        """Write one generated file into an existing project directory"""
+        path = os.path.join(self._base, rel_path)
+        with open(path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(contents)
+
+    def _copy_template(self, rel_path: str, template: str) -> None:
+        """Copy a file template into the project, relative to its directory"""
+        # Every template lands in a directory _create_project_structure has
+        # already made
+        path = os.path.join(self._base, rel_path)
+        # copyfile uses sendfile where available, so the template contents
+        # never pass through Python
+        shutil.copyfile(os.path.join(_TEMPLATE_DIR, template), path)
 
-def test_websocket_connection():
-    with client.websocket_connect("/ws/test-room") as websocket:
-        # Test basic WebSocket connection
-        websocket.send_text('{"type": "test", "message": "hello"}')
-        data = websocket.receive_text()
-        assert data is not None
+    def generate_chat_application(self, requirements: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate a real chat application with actual code files"""
+        return self._materialize("chat", _CHAT_APPLICATION)
 
-class TestAuthentication:
-    def test_register_user(self):
-        response = client.post("/api/auth/register", json={
-            "username": "testuser",
-            "email": "test@example.com",
-            "password": "testpass123",
-            "full_name": "Test User"
-        })
-        assert response.status_code == 201
-        assert "user_id" in response.json()
+    def generate_fintech_application(
+        self, requirements: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Generate a fintech CPA system with specialized agents"""
+        return self._materialize("fintech", _FINTECH_APPLICATION)
 
-    def test_login_user(self):
-        # First register a user
-        client.post("/api/auth/register", json={
-            "username": "logintest",
-            "email": "login@example.com", 
-            "password": "testpass123"
-        })
-        
-        # Then login
-        response = client.post("/api/auth/login", json={
-            "username": "logintest",
-            "password": "testpass123"
-        })
-        assert response.status_code == 200
-        assert "access_token" in response.json()
+    def generate_generic_application(
+        self, requirements: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Generate a generic project scaffold"""
+        # The scaffold is a single file at the project root
+        os.makedirs(self._base, exist_ok=True)
+        self._write("README.md", _GENERIC_README)
+        return {
+            "project_path": self._base,
+            "files_generated": {"documentation": ["README.md"]},
+            "total_files": 1,
+        }
 
-class TestRooms:
-    def test_create_room(self):
-        # Login first to get token
-        login_response = client.post("/api/auth/login", json={
-            "username": "logintest",
-            "password": "testpass123"
-        })
-        token = login_response.json()["access_token"]
-        
-        response = client.post("/api/rooms/", 
-            json={"name": "Test Room", "description": "A test room"},
-            headers={"Authorization": f"Bearer {token}"}
+    def _materialize(
+        self, name: str, sections: Dict[str, Tuple[Tuple[str, str], ...]]
+    ) -> Dict[str, Any]:
+        """Copy an application's skeleton into the project and summarize it"""
+        # Generated projects are identical for a given application type, so
+        # each one is a single tree copy of the prebuilt skeleton. Files are
+        # copied without their metadata, and regenerating into an existing
+        # project leaves unchanged files alone
+        shutil.copytree(
+            self._skeleton(name, sections),
+            self._base,
+            copy_function=_copy_if_changed,
+            dirs_exist_ok=True,
         )
-        assert response.status_code == 201
-        assert response.json()["name"] == "Test Room"
 
-    def test_list_rooms(self):
-        response = client.get("/api/rooms/")
-        assert response.status_code == 200
-        assert isinstance(response.json(), list)
-'''
+        return {
+            "project_path": self._base,
+            "files_generated": {
+                section: list(paths) for section, paths in _MANIFESTS[name].items()
+            },
+            "total_files": _TOTAL_FILES[name],
+        }
 
-        with open(self.project_dir / "backend" / "tests" / "test_main.py", "w") as f:
-            f.write(test_main)
-        files_created.append("backend/tests/test_main.py")
+    @classmethod
+    def _skeleton(
+        cls, name: str, sections: Dict[str, Tuple[Tuple[str, str], ...]]
+    ) -> str:
+        """Directory holding the application's skeleton, built on first use"""
+        with cls._skeleton_lock:
+            skeleton = cls._skeletons.get(name)
+            # The skeleton lives in the temp directory, where a tmp cleaner
+            # may remove it while the process is still running
+            if skeleton is None or not _skeleton_intact(skeleton, sections):
+                if skeleton is not None:
+                    shutil.rmtree(os.path.dirname(skeleton), ignore_errors=True)
+                # mkdtemp creates its directory 0700 and copytree copies the
+                # root's mode onto every project, so the skeleton is a normal
+                # directory created inside it
+                root = tempfile.mkdtemp(prefix=f"{name}_skeleton_")
+                atexit.register(shutil.rmtree, root, ignore_errors=True)
+                skeleton = os.path.join(root, name)
+                cls(skeleton)._emit_project(sections)
+                cls._skeletons[name] = skeleton
+            return skeleton
+
+    def _emit_project(self, sections: Dict[str, Tuple[Tuple[str, str], ...]]) -> None:
+        """Create the directory structure and copy every file template"""
+        self._create_project_structure()
+        files = [file for section in sections.values() for file in section]
+        # Copies are independent and block in the OS, so overlap them
+        with ThreadPoolExecutor(max_workers=min(8, len(files)) or 1) as executor:
+            list(executor.map(lambda file: self._copy_template(*file), files))
 
-        return files_created
+    def _create_project_structure(self) -> None:
+        """Create the actual directory structure"""
+        os.makedirs(self._base, exist_ok=True)
+        # Parents always come before their children, so a plain mkdir per
+        # directory is enough
+        for dir_path in _PROJECT_DIRS:
+            try:
+                os.mkdir(os.path.join(self._base, dir_path))
+            except FileExistsError:
+                pass
 
 
 # Example usage
@@ -0,0 +1,174 @@
+import React, { useState, useEffect, useRef } from 'react';
+import { useParams, Link } from 'react-router-dom';
+import './Chat.css';
+
+const Chat = ({ user, token }) => {
+  const { roomId } = useParams();
+  const [messages, setMessages] = useState([]);
+  const [newMessage, setNewMessage] = useState('');
+  const [onlineUsers, setOnlineUsers] = useState([]);
+  const [isTyping, setIsTyping] = useState(false);
+  const [typingUsers, setTypingUsers] = useState([]);
+  const websocket = useRef(null);
+  const messagesEndRef = useRef(null);
+
+  useEffect(() => {
+    // Connect to WebSocket
+    const wsUrl = `ws://localhost:8000/ws/${roomId}?token=${token}`;
+    websocket.current = new WebSocket(wsUrl);
+
+    websocket.current.onopen = () => {
+      /* connection established */
+    };
+
+    websocket.current.onmessage = (event) => {
+      const data = JSON.parse(event.data);
+      
+      if (data.type === 'message') {
+        setMessages(prev => [...prev, data]);
+      } else if (data.type === 'user_joined') {
+        setOnlineUsers(prev => [...prev, data.user]);
+      } else if (data.type === 'user_left') {
+        setOnlineUsers(prev => prev.filter(u => u.user_id !== data.user.user_id));
+      } else if (data.type === 'typing') {
+        if (data.user_id !== user.id) {
+          setTypingUsers(prev => [...prev.filter(id => id !== data.user_id), data.user_id]);
+          setTimeout(() => {
+            setTypingUsers(prev => prev.filter(id => id !== data.user_id));
+          }, 3000);
+        }
+      }
+    };
+
+    websocket.current.onclose = () => {
+      /* connection closed */
+    };
+
+    // Load message history
+    loadMessageHistory();
+
+    return () => {
+      if (websocket.current) {
+        websocket.current.close();
+      }
+    };
+  }, [roomId, token]);
+
+  useEffect(() => {
+    scrollToBottom();
+  }, [messages]);
+
+  const loadMessageHistory = async () => {
+    try {
+      const response = await fetch(`/api/rooms/${roomId}/messages`, {
+        headers: { Authorization: `Bearer ${token}` }
+      });
+      if (response.ok) {
+        const history = await response.json();
+        setMessages(history);
+      }
+    } catch (error) {
+      console.error('Error loading message history:', error);
+    }
+  };
+
+  const sendMessage = () => {
+    if (newMessage.trim() && websocket.current) {
+      const messageData = {
+        type: 'message',
+        content: newMessage,
+        sender: user,
+        timestamp: new Date().toISOString(),
+        room_id: roomId
+      };
+      
+      websocket.current.send(JSON.stringify(messageData));
+      setNewMessage('');
+    }
+  };
+
+  const handleKeyPress = (e) => {
+    if (e.key === 'Enter' && !e.shiftKey) {
+      e.preventDefault();
+      sendMessage();
+    } else {
+      // Send typing indicator
+      if (websocket.current && !isTyping) {
+        setIsTyping(true);
+        websocket.current.send(JSON.stringify({
+          type: 'typing',
+          user_id: user.id,
+          username: user.username
+        }));
+        
+        setTimeout(() => setIsTyping(false), 1000);
+      }
+    }
+  };
+
+  const scrollToBottom = () => {
+    messagesEndRef.current?.scrollIntoView({ behavior: 'smooth' });
+  };
+
+  return (
+    <div className="chat-container">
+      <div className="chat-header">
+        <Link to="/rooms" className="back-button">← Back to Rooms</Link>
+        <h2>Room {roomId}</h2>
+        <div className="online-users">
+          Online: {onlineUsers.length}
+        </div>
+      </div>
+
+      <div className="chat-main">
+        <div className="messages-container">
+          {messages.map((message, index) => (
+            <div key={index} className={`message ${message.sender?.id === user.id ? 'own-message' : ''}`}>
+              <div className="message-header">
+                <span className="sender">{message.sender?.username || 'Anonymous'}</span>
+                <span className="timestamp">
+                  {new Date(message.timestamp).toLocaleTimeString()}
+                </span>
+              </div>
+              <div className="message-content">{message.content}</div>
+            </div>
+          ))}
+          
+          {typingUsers.length > 0 && (
+            <div className="typing-indicator">
+              {typingUsers.join(', ')} {typingUsers.length === 1 ? 'is' : 'are'} typing...
+            </div>
+          )}
+          
+          <div ref={messagesEndRef} />
+        </div>
+
+        <div className="online-users-sidebar">
+          <h3>Online Users ({onlineUsers.length})</h3>
+          {onlineUsers.map(user => (
+            <div key={user.user_id} className="online-user">
+              <span className="status-indicator online"></span>
+              {user.username}
+            </div>
+          ))}
+        </div>
+      </div>
+
+      <div className="message-input-container">
+        <textarea
+          value={newMessage}
+          onChange={(e) => setNewMessage(e.target.value)}
+          onKeyPress={handleKeyPress}
+          placeholder="Type your message... (Press Enter to send)"
+          className="message-input"
+          rows="3"
+        />
+        <button onClick={sendMessage} className="send-button">
+          Send
+        </button>
+      </div>
+    </div>
+  );
+};
+
+export default Chat;
\ No newline at end of file
@@ -0,0 +1,8 @@
+"""FinTech CPA Multi-Agent System Backend"""
+from fastapi import FastAPI
+
+app = FastAPI()
+
+@app.get("/health")
+async def health() -> dict:
+    return {"status": "healthy", "system": "fintech_cpa"}
@@ -3,47 +3,104 @@
 Comprehensive test suite for the Multi-Agent AI System
 Tests all major functionality and validates the system is working correctly
 """
+import asyncio
+import functools
 import json
 import time
 import sys
-from typing import Any
+from typing import Any, List, Optional
 
 import pytest
 
 try:
-    import requests
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import httpx
 except ModuleNotFoundError:  # pragma: no cover - dependency missing
-    pytest.skip("requests not installed", allow_module_level=True)
+    pytest.skip("httpx not installed", allow_module_level=True)
 
 # Test configuration
 BASE_URL = "http://localhost:8000"
 API_BASE = f"{BASE_URL}/api/v1"
 
 
+def _json(response: httpx.Response) -> Any:
+    """Decode a JSON response body, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def require_uuid(test_name: str):
+    """Fail a project-scoped test up front when no project has been created"""
+
+    def decorator(test_func):
+        @functools.wraps(test_func)
+        async def wrapper(self, *args, **kwargs):
+            if not self.project_uuid:
+                self.log_test(test_name, False, "No project UUID available")
+                return False
+            return await test_func(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
 class SystemTester:
     """Comprehensive system tester"""
 
+    __slots__ = (
+        "test_results",
+        "project_uuid",
+        "_client",
+        "_log_buf",
+        "_passed",
+        "_failed",
+    )
+
     def __init__(self):
         self.test_results = []
         self.project_uuid = None
+        # Shared keep-alive client, open for the duration of run_all_tests
+        self._client: Optional[httpx.AsyncClient] = None
+        # Result lines, written to stdout in one go by _flush
+        self._log_buf: List[str] = []
+        # Running totals, so the report does not rescan test_results
+        self._passed = 0
+        self._failed = 0
 
     def log_test(
         self, test_name: str, success: bool, message: str = "", data: Any = None
     ):
         """Log test result"""
         status = "PASS" if success else "FAIL"
-        print(f"[{status}] {test_name}: {message}")
+        self._log_buf.append(f"[{status}] {test_name}: {message}\n")
+        if success:
+            self._passed += 1
+        else:
+            self._failed += 1
 
         self.test_results.append(
             {"test": test_name, "success": success, "message": message, "data": data}
         )
 
-    def test_health_check(self):
+    def _flush(self):
+        """Write out the buffered result lines"""
+        if self._log_buf:
+            sys.stdout.write("".join(self._log_buf))
+            sys.stdout.flush()
+            self._log_buf.clear()
+
+    async def test_health_check(self):
         """Test system health endpoint"""
         try:
-            response = requests.get(f"{BASE_URL}/health", timeout=5)
+            response = await self._client.get(f"{BASE_URL}/health", timeout=5)
             if response.status_code == 200:
-                data = response.json()
+                data = _json(response)
                 if data.get("status") == "healthy":
                     self.log_test("Health Check", True, "System is healthy", data)
                     return True
@@ -61,12 +118,12 @@ class SystemTester:
             self.log_test("Health Check", False, f"Exception: {e}")
             return False
 
-    def test_system_status(self):
+    async def test_system_status(self):
         """Test system status endpoint"""
         try:
-            response = requests.get(f"{BASE_URL}/status", timeout=10)
+            response = await self._client.get(f"{BASE_URL}/status", timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = _json(response)
                 self.log_test("System Status", True, "System status retrieved", data)
                 return True
             else:
@@ -76,7 +133,7 @@ class SystemTester:
             self.log_test("System Status", False, f"Exception: {e}")
             return False
 
-    def test_project_creation(self):
+    async def test_project_creation(self):
         """Test project creation"""
         try:
             project_data = {
@@ -86,7 +143,7 @@ class SystemTester:
                 "requirements": "User registration and authentication, Product catalog with search and filtering, Shopping cart functionality, Payment processing integration, Responsive design for mobile and desktop, Admin panel for product management, Order tracking system, Email notifications",
             }
 
-            response = requests.post(
+            response = await self._client.post(
                 f"{API_BASE}/projects/",
                 json=project_data,
                 headers={"Content-Type": "application/json"},
@@ -94,7 +151,7 @@ class SystemTester:
             )
 
             if response.status_code == 200:
-                data = response.json()
+                data = _json(response)
                 self.project_uuid = data.get("project_uuid")
                 if self.project_uuid:
                     self.log_test(
@@ -118,24 +175,32 @@ class SystemTester:
             self.log_test("Project Creation", False, f"Exception: {e}")
             return False
 
-    def test_project_processing(self):
+    @require_uuid("Project Processing")
+    async def test_project_processing(self):
         """Test project processing by monitoring status"""
-        if not self.project_uuid:
-            self.log_test("Project Processing", False, "No project UUID available")
-            return False
-
         try:
             # Monitor project status for up to 60 seconds
             start_time = time.time()
             max_wait = 60
+            # Poll quickly at first, backing off to at most every 2 seconds
+            delay = 0.1
+            # ETag of the last status seen; the server answers 304 while unchanged
+            etag = None
+            status_url = f"{API_BASE}/projects/{self.project_uuid}/status"
 
             while time.time() - start_time < max_wait:
-                response = requests.get(
-                    f"{API_BASE}/projects/{self.project_uuid}/status", timeout=10
+                headers = {"If-None-Match": etag} if etag else None
+                response = await self._client.get(
+                    status_url, headers=headers, timeout=10
                 )
 
-                if response.status_code == 200:
-                    data = response.json()
+                if response.status_code == 304:
+                    # No change since the last poll
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 1.7, 2.0)
+                elif response.status_code == 200:
+                    etag = response.headers.get("etag")
+                    data = _json(response)
                     status = data.get("status")
                     progress = data.get("progress", 0)
                     current_phase = data.get("current_phase")
@@ -161,7 +226,8 @@ class SystemTester:
                         return False
 
                     # Wait before next check
-                    time.sleep(2)
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 1.7, 2.0)
                 else:
                     self.log_test(
                         "Project Processing", False, f"HTTP {response.status_code}"
@@ -176,19 +242,16 @@ class SystemTester:
             self.log_test("Project Processing", False, f"Exception: {e}")
             return False
 
-    def test_project_results(self):
+    @require_uuid("Project Results")
+    async def test_project_results(self):
         """Test retrieving project results"""
-        if not self.project_uuid:
-            self.log_test("Project Results", False, "No project UUID available")
-            return False
-
         try:
-            response = requests.get(
+            response = await self._client.get(
                 f"{API_BASE}/projects/{self.project_uuid}/results", timeout=10
             )
 
             if response.status_code == 200:
-                data = response.json()
+                data = _json(response)
                 self.log_test(
                     "Project Results", True, "Results retrieved successfully", data
                 )
@@ -204,13 +267,13 @@ class SystemTester:
             self.log_test("Project Results", False, f"Exception: {e}")
             return False
 
-    def test_project_listing(self):
+    async def test_project_listing(self):
         """Test project listing"""
         try:
-            response = requests.get(f"{API_BASE}/projects/", timeout=10)
+            response = await self._client.get(f"{API_BASE}/projects/", timeout=10)
 
             if response.status_code == 200:
-                data = response.json()
+                data = _json(response)
                 if isinstance(data, list):
                     self.log_test(
                         "Project Listing",
@@ -229,10 +292,10 @@ class SystemTester:
             self.log_test("Project Listing", False, f"Exception: {e}")
             return False
 
-    def test_api_documentation(self):
+    async def test_api_documentation(self):
         """Test API documentation availability"""
         try:
-            response = requests.get(f"{BASE_URL}/docs", timeout=5)
+            response = await self._client.get(f"{BASE_URL}/docs", timeout=5)
             if response.status_code == 200:
                 self.log_test("API Documentation", True, "Documentation is accessible")
                 return True
@@ -251,23 +314,9 @@ class SystemTester:
         print("Multi-Agent AI System - Comprehensive Test Suite")
         print("=" * 60)
 
-        tests = [
-            ("Health Check", self.test_health_check),
-            ("System Status", self.test_system_status),
-            ("API Documentation", self.test_api_documentation),
-            ("Project Creation", self.test_project_creation),
-            ("Project Processing", self.test_project_processing),
-            ("Project Results", self.test_project_results),
-            ("Project Listing", self.test_project_listing),
-        ]
-
-        passed = 0
-        total = len(tests)
-
-        for test_name, test_func in tests:
-            print(f"\nRunning {test_name}...")
-            if test_func():
-                passed += 1
+        outcomes = asyncio.run(self._run_tests())
+        passed = sum(outcomes)
+        total = len(outcomes)
 
         print("\n" + "=" * 60)
         print(f"Test Results: {passed}/{total} tests passed")
@@ -282,18 +331,57 @@ class SystemTester:
             print(f"❌ {total - passed} tests failed. Please check the system.")
             return False
 
+    async def _run_tests(self):
+        """Run the tests over one shared client; returns each test's outcome"""
+        independent = [
+            ("Health Check", self.test_health_check),
+            ("System Status", self.test_system_status),
+            ("API Documentation", self.test_api_documentation),
+            ("Project Listing", self.test_project_listing),
+        ]
+        # Each step needs the project created by the one before it
+        project_lifecycle = [
+            ("Project Creation", self.test_project_creation),
+            ("Project Processing", self.test_project_processing),
+            ("Project Results", self.test_project_results),
+        ]
+
+        limits = httpx.Limits(max_connections=8, max_keepalive_connections=4)
+        async with httpx.AsyncClient(timeout=10, limits=limits) as client:
+            self._client = client
+            try:
+                print(f"\nRunning {', '.join(name for name, _ in independent)}...")
+                outcomes = list(
+                    await asyncio.gather(*(test_func() for _, test_func in independent))
+                )
+                self._flush()
+
+                for test_name, test_func in project_lifecycle:
+                    print(f"\nRunning {test_name}...")
+                    outcomes.append(await test_func())
+                    self._flush()
+            finally:
+                self._client = None
+                self._flush()
+
+        return outcomes
+
     def generate_report(self):
         """Generate detailed test report"""
         report = {
             "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
             "total_tests": len(self.test_results),
-            "passed_tests": sum(1 for r in self.test_results if r["success"]),
-            "failed_tests": sum(1 for r in self.test_results if not r["success"]),
+            "passed_tests": self._passed,
+            "failed_tests": self._failed,
             "test_details": self.test_results,
         }
 
-        with open("test_report.json", "w") as f:
-            json.dump(report, f, indent=2)
+        if orjson is not None:
+            with open("test_report.json", "wb") as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            with open("test_report.json", "w") as f:
+                json.dump(report, f, indent=2)
 
         print("\nDetailed test report saved to: test_report.json")
         return report
@@ -305,7 +393,7 @@ def main():
 
     # Check if server is running
     try:
-        response = requests.get(f"{BASE_URL}/health", timeout=5)
+        response = httpx.get(f"{BASE_URL}/health", timeout=5)
         if response.status_code != 200:
             print(
                 "❌ Server is not running or not responding. Please start the server first."